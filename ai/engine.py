@@ -463,6 +463,13 @@ class AIEngine:
         """Execute a financial data tool and return the result."""
         log.info("tool_call", tool=tool_name, input=tool_input)
 
+        # The model may pass "aapl"; upper-case so tool calls share cache entries with the cogs
+        if isinstance(tool_input.get("symbol"), str):
+            tool_input = {**tool_input, "symbol": tool_input["symbol"].upper()}
+        if isinstance(tool_input.get("symbols"), list):
+            symbols = [s.upper() if isinstance(s, str) else s for s in tool_input["symbols"]]
+            tool_input = {**tool_input, "symbols": symbols}
+
         try:
             match tool_name:
                 case "get_quote":
@@ -1,6 +1,7 @@
 """PDF/image handling for multimodal Claude content blocks."""
 
 import base64
+from dataclasses import dataclass
 import aiohttp
 import structlog
 from typing import Any
@@ -12,11 +13,30 @@ SUPPORTED_DOC_TYPES = {"pdf"}
 MAX_FILE_SIZE = 20 * 1024 * 1024  # 20MB
 
 
+@dataclass(frozen=True, slots=True)
+class AttachmentRef:
+    """Minimal projection of a Discord attachment — only what processing needs."""
+
+    url: str
+    filename: str
+    content_type: str | None
+    size: int
+
+    @classmethod
+    def from_attachment(cls, attachment: Any) -> "AttachmentRef":
+        return cls(
+            url=attachment.url,
+            filename=attachment.filename,
+            content_type=attachment.content_type,
+            size=attachment.size,
+        )
+
+
 async def process_attachments(attachments: list[Any]) -> list[dict[str, Any]]:
     """Process Discord attachments into Claude content blocks.
 
     Args:
-        attachments: List of discord.Attachment objects.
+        attachments: List of AttachmentRef (or discord.Attachment) objects.
 
     Returns:
         List of content blocks for the Claude API.
@@ -249,7 +249,8 @@ FINANCIAL_TOOLS = [
         "name": "get_sentiment",
         "description": (
             "Get news sentiment time series for one or more stocks — shows how media sentiment has trended "
-            "over recent days. Returns daily article counts and average sentiment (-1 to +1) per symbol. "
+            "over recent days. Returns daily article counts and average sentiment (-1 to +1) per symbol, "
+            "with the timeline as parallel lists (date[i] pairs with articles[i], sentiment_avg[i], ...). "
             "Use when the user asks about sentiment, media tone, 'what does the market think about X?', "
             "or to compare sentiment across multiple tickers."
         ),
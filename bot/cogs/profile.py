@@ -144,7 +144,7 @@ class ProfileCog(commands.Cog):
         metric_list = [m.strip() for m in metrics.split(",") if m.strip()]
         valid = [m for m in metric_list if m in METRIC_OPTIONS]
         if not valid:
-            options = ", ".join(METRIC_OPTIONS)
+            options = ", ".join(sorted(METRIC_OPTIONS))
             await ctx.respond(
                 embed=make_embed("Invalid Metrics", f"Valid options: {options}", color=EmbedColor.WARNING),
                 ephemeral=True,
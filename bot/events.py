@@ -4,6 +4,7 @@ import time
 import discord
 import structlog
 from bot.client import ShaoBuffettBot
+from ai.multimodal import AttachmentRef
 
 log = structlog.get_logger(__name__)
 
@@ -57,7 +58,7 @@ def setup_events(bot: ShaoBuffettBot) -> None:
             author=str(message.author),
             is_dm=is_dm,
             is_mentioned=is_mentioned,
-            mentions=[str(u) for u in message.mentions],
+            mention_count=len(message.mentions),
             content_preview=message.content[:80],
         )
         if not is_dm and not is_mentioned:
@@ -123,7 +124,7 @@ def setup_events(bot: ShaoBuffettBot) -> None:
                 user_id=message.author.id,
                 channel_id=message.channel.id,
                 content=content,
-                attachments=message.attachments,
+                attachments=[AttachmentRef.from_attachment(a) for a in message.attachments],
                 on_tool_start=on_tool_start,
                 on_text_chunk=on_text_chunk,
                 send_file=send_file,
@@ -5,6 +5,7 @@ import structlog
 from config.settings import settings
 from config.logging_config import setup_logging
 from storage.database import get_pool, close_pool, run_migrations
+from storage.repositories.cache_repo import CacheRepository
 from bot.client import ShaoBuffettBot
 from bot.events import setup_events
 from data.manager import DataManager
@@ -28,7 +29,7 @@ async def start_bot() -> None:
     bot.db_pool = pool
 
     # Initialize data layer
-    data_manager = DataManager()
+    data_manager = DataManager(persistent=CacheRepository(pool))
     await data_manager.start()
     bot.data_manager = data_manager
 
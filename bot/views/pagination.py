@@ -11,33 +11,36 @@ class PaginatorView(discord.ui.View):
         self.embeds = embeds
         self.author_id = author_id
         self.current_page = 0
+        self._last = len(embeds) - 1
+        # Footers are fixed per page — set them once instead of on every click
+        for i, embed in enumerate(embeds):
+            embed.set_footer(text=f"Page {i + 1}/{len(embeds)} • Shao Buffett")
         self._update_buttons()
 
     def _update_buttons(self) -> None:
         self.prev_button.disabled = self.current_page == 0
-        self.next_button.disabled = self.current_page >= len(self.embeds) - 1
+        self.next_button.disabled = self.current_page >= self._last
 
     @discord.ui.button(label="Previous", style=discord.ButtonStyle.secondary, emoji="◀")
     async def prev_button(self, button: discord.ui.Button, interaction: discord.Interaction) -> None:
         if interaction.user.id != self.author_id:
             await interaction.response.send_message("This isn't your pagination.", ephemeral=True)
             return
+        # ACK immediately so slow handling can't miss Discord's 3s window
+        await interaction.response.defer()
         self.current_page = max(0, self.current_page - 1)
         self._update_buttons()
-        embed = self.embeds[self.current_page]
-        embed.set_footer(text=f"Page {self.current_page + 1}/{len(self.embeds)} • Shao Buffett")
-        await interaction.response.edit_message(embed=embed, view=self)
+        await interaction.edit_original_response(embed=self.embeds[self.current_page], view=self)
 
     @discord.ui.button(label="Next", style=discord.ButtonStyle.secondary, emoji="▶")
     async def next_button(self, button: discord.ui.Button, interaction: discord.Interaction) -> None:
         if interaction.user.id != self.author_id:
             await interaction.response.send_message("This isn't your pagination.", ephemeral=True)
             return
-        self.current_page = min(len(self.embeds) - 1, self.current_page + 1)
+        await interaction.response.defer()
+        self.current_page = min(self._last, self.current_page + 1)
         self._update_buttons()
-        embed = self.embeds[self.current_page]
-        embed.set_footer(text=f"Page {self.current_page + 1}/{len(self.embeds)} • Shao Buffett")
-        await interaction.response.edit_message(embed=embed, view=self)
+        await interaction.edit_original_response(embed=self.embeds[self.current_page], view=self)
 
     async def on_timeout(self) -> None:
         for child in self.children:
@@ -58,15 +61,17 @@ class ConfirmView(discord.ui.View):
         if interaction.user.id != self.author_id:
             await interaction.response.send_message("Not your action.", ephemeral=True)
             return
+        await interaction.response.defer()
         self.confirmed = True
         self.stop()
-        await interaction.response.edit_message(content="Confirmed.", view=None)
+        await interaction.edit_original_response(content="Confirmed.", view=None)
 
     @discord.ui.button(label="Cancel", style=discord.ButtonStyle.danger)
     async def cancel(self, button: discord.ui.Button, interaction: discord.Interaction) -> None:
         if interaction.user.id != self.author_id:
             await interaction.response.send_message("Not your action.", ephemeral=True)
             return
+        await interaction.response.defer()
         self.confirmed = False
         self.stop()
-        await interaction.response.edit_message(content="Cancelled.", view=None)
+        await interaction.edit_original_response(content="Cancelled.", view=None)
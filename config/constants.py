@@ -3,6 +3,11 @@
 import re
 from enum import Enum
 
+try:
+    import ahocorasick
+except ImportError:  # regex fallback in is_ai_related()
+    ahocorasick = None
+
 
 # Discord embed colors
 class EmbedColor(int, Enum):
@@ -31,6 +36,17 @@ API_RATE_LIMITS = {
     "arxiv": 10,
 }
 
+# Limiter algorithm per API (default "gcra"). Providers with tight quotas or
+# fanned-out callers use a sliding window so a batch of calls can go out
+# together instead of being spaced out by GCRA's small burst.
+RATE_LIMIT_ALGORITHMS = {
+    "finnhub": "sliding",
+    "fmp": "sliding",
+    "sec_edgar": "sliding",
+    "marketaux": "sliding",
+    "arxiv": "sliding",
+}
+
 # Polling intervals (seconds)
 POLL_INTERVALS = {
     "news": 180,          # 3 min (falls back to Finnhub when MarketAux exhausted)
@@ -46,17 +62,33 @@ POLL_INTERVALS = {
 CACHE_TTL = {
     "quote": 60,          # 1 min (FMP-sourced now)
     "profile": 86400,     # 1 day
+    "peers": 86400,       # 1 day
     "fundamentals": 3600, # 1 hour
     "news": 120,          # 2 min (polls every 3 min, fresh data most cycles)
     "analyst": 7200,      # 2 hours
     "macro": 1800,        # 30 min
     "earnings": 3600,     # 1 hour
-    "transcript": 86400,  # 1 day
+    "transcript": 604800, # 1 week (a published transcript never changes)
     "filing": 86400,      # 1 day
+    "insider": 86400,     # 1 day (Form 4s are filed within two business days)
+    "sector_perf": 3600,  # 1 hour
+    "technicals": 1800,   # 30 min
+    "hist_prices": 3600,  # 1 hour (only the latest daily bar moves)
+}
+
+# Extra seconds an expired entry may still be served while a background refresh runs
+# (quotes and the macro snapshot are deliberately absent: price alerts and macro
+# release alerts need them fresh)
+CACHE_STALE_TTL = {
+    "profile": 86400,      # company profiles
+    "fundamentals": 1800,  # key metrics/ratios
+    "sector_perf": 1800,
+    "technicals": 1800,
+    "news": 300,           # general feed
 }
 
 # Sectors
-SECTORS = [
+SECTORS = (
     "Technology",
     "Healthcare",
     "Financial Services",
@@ -68,10 +100,10 @@ SECTORS = [
     "Utilities",
     "Real Estate",
     "Basic Materials",
-]
+)
 
-# Focused metrics options
-METRIC_OPTIONS = [
+# Focused metrics options (frozenset: only ever used for membership checks)
+METRIC_OPTIONS = frozenset({
     "pe_ratio",
     "forward_pe",
     "eps",
@@ -88,7 +120,7 @@ METRIC_OPTIONS = [
     "price_to_book",
     "price_to_sales",
     "current_ratio",
-]
+})
 
 # Notification types
 class NotificationType(str, Enum):
@@ -122,7 +154,7 @@ MAX_EMBED_FIELD_VALUE = 1024
 MAX_AI_NEWS_PER_USER = 3
 
 # AI/tech news keyword matching
-AI_NEWS_KEYWORDS = [
+AI_NEWS_KEYWORDS = (
     # Companies
     "OpenAI", "Anthropic", "DeepMind", "Google AI", "Meta AI", "Microsoft AI",
     "Nvidia", "xAI", "Mistral", "Cohere", "Stability AI", "Hugging Face",
@@ -136,13 +168,32 @@ AI_NEWS_KEYWORDS = [
     "AI safety", "AI regulation", "AI chip", "AI accelerator",
     "artificial intelligence", "AGI", "AI model", "AI startup",
     "AI agent", "multimodal AI",
-]
-_AI_NEWS_RE = re.compile(
-    "|".join(re.escape(kw) for kw in AI_NEWS_KEYWORDS),
-    re.IGNORECASE,
 )
+# Matched against lowercased text: a case-sensitive pattern is several times
+# faster than re.IGNORECASE for the same alternation.
+_AI_NEWS_RE = re.compile("|".join(re.escape(kw.lower()) for kw in AI_NEWS_KEYWORDS))
+_AI_MIN_KEYWORD_LEN = min(len(kw) for kw in AI_NEWS_KEYWORDS)
+
+
+def _build_ai_automaton():
+    """Build an Aho-Corasick automaton over the lowercased keywords (single pass per text)."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for kw in AI_NEWS_KEYWORDS:
+        automaton.add_word(kw.lower(), kw)
+    automaton.make_automaton()
+    return automaton
+
+
+_AI_AUTOMATON = _build_ai_automaton()
 
 
 def is_ai_related(text: str) -> bool:
     """Check if text contains AI/tech keywords."""
-    return bool(_AI_NEWS_RE.search(text))
+    if len(text) < _AI_MIN_KEYWORD_LEN:
+        return False
+    lowered = text.lower()
+    if _AI_AUTOMATON is not None:
+        return next(_AI_AUTOMATON.iter(lowered), None) is not None
+    return _AI_NEWS_RE.search(lowered) is not None
@@ -11,18 +11,9 @@ def comparison_chart(
     title: str = "Stock Comparison",
 ) -> go.Figure:
     """Create a bar chart comparing stock prices and changes."""
-    names = []
-    prices = []
-    changes = []
-    colors = []
-
-    for quote in quotes:
-        sym = quote.get("symbol", "")
-        names.append(sym)
-        prices.append(quote.get("price", 0))
-        change = quote.get("change_pct", 0)
-        changes.append(change)
-        colors.append("#00C853" if change >= 0 else "#FF1744")
+    names = [q.get("symbol", "") for q in quotes]
+    changes = [q.get("change_pct", 0) for q in quotes]
+    colors = ["#00C853" if c >= 0 else "#FF1744" for c in changes]
 
     fig = go.Figure()
 
@@ -49,18 +40,12 @@ def comparison_chart(
 
 def sector_heatmap(sectors: list[dict[str, Any]], title: str = "Sector Performance") -> go.Figure:
     """Create a treemap/heatmap of sector performance."""
-    names = []
-    values = []
-    colors_list = []
-
-    for s in sectors:
-        name = s.get("sector", s.get("name", "Unknown"))
-        change = s.get("changesPercentage", 0)
-        if isinstance(change, str):
-            change = float(change.replace("%", ""))
-        names.append(name)
-        values.append(abs(change) + 0.1)  # Ensure positive for treemap
-        colors_list.append(change)
+    names = [s.get("sector", s.get("name", "Unknown")) for s in sectors]
+    colors_list = [
+        float(c.replace("%", "")) if isinstance(c := s.get("changesPercentage", 0), str) else c
+        for s in sectors
+    ]
+    values = [abs(c) + 0.1 for c in colors_list]  # Ensure positive for treemap
 
     fig = go.Figure(go.Treemap(
         labels=names,
@@ -138,15 +123,10 @@ def macro_trend_chart(
     title: str | None = None,
 ) -> go.Figure:
     """Create a line chart for a macro data series."""
-    dates = []
-    values = []
-
-    for obs in reversed(observations):
-        val = obs.get("value", ".")
-        if val == ".":
-            continue
-        dates.append(obs.get("date", ""))
-        values.append(float(val))
+    # FRED marks missing observations with "."
+    points = [obs for obs in reversed(observations) if obs.get("value", ".") != "."]
+    dates = [obs.get("date", "") for obs in points]
+    values = [float(obs["value"]) for obs in points]
 
     fig = go.Figure()
 
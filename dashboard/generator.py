@@ -1,14 +1,49 @@
 """Dashboard composition — builds multi-chart dashboards."""
 
+import asyncio
+import hashlib
+import io
 import discord
+import orjson
+import plotly.graph_objects as go
 import structlog
-from typing import Any
+from typing import Any, Callable
+from config.constants import CACHE_TTL
+from data.cache import TTLCache
 from data.manager import DataManager
 from dashboard.charts import comparison_chart, sector_heatmap, earnings_chart, macro_trend_chart, price_chart
-from dashboard.renderer import render_to_discord_file
+from dashboard.renderer import render_to_bytes_async
 
 log = structlog.get_logger(__name__)
 
+# Rendered PNGs keyed by a fingerprint of the chart inputs, so repeat requests
+# for unchanged data skip Kaleido entirely.
+_chart_cache = TTLCache(max_size=256)
+
+
+def _chart_key(chart_type: str, data: Any) -> str:
+    """Fingerprint chart inputs (BLAKE2b over canonical JSON)."""
+    payload = orjson.dumps(data, option=orjson.OPT_SORT_KEYS, default=str)
+    return f"{chart_type}:{hashlib.blake2b(payload, digest_size=16).hexdigest()}"
+
+
+async def _render_cached(
+    chart_type: str,
+    data: Any,
+    build: Callable[[], go.Figure],
+    filename: str,
+    ttl: int,
+) -> discord.File:
+    """Render a chart, reusing cached PNG bytes when the inputs are unchanged."""
+    key = _chart_key(chart_type, data)
+    image_bytes = _chart_cache.get(key)
+    if image_bytes is None:
+        image_bytes = await render_to_bytes_async(build())
+        # Nothing else sweeps this cache; cheap when nothing has expired
+        _chart_cache.cleanup()
+        _chart_cache.set(key, image_bytes, ttl)
+    return discord.File(io.BytesIO(image_bytes), filename=filename)
+
 
 class DashboardGenerator:
     """Generate dashboard chart images for Discord."""
@@ -22,18 +57,19 @@ class DashboardGenerator:
         """Generate a dashboard for a user's watchlist."""
         files = []
 
-        # Comparison chart
-        quotes = []
-        for symbol in symbols[:10]:
-            try:
-                q = await self.dm.get_quote(symbol)
-                quotes.append(q)
-            except Exception:
-                pass
+        # Comparison chart — fetch all quotes concurrently
+        results = await asyncio.gather(
+            *(self.dm.get_quote(symbol) for symbol in symbols[:10]),
+            return_exceptions=True,
+        )
+        quotes = [q for q in results if q and not isinstance(q, BaseException)]
 
         if quotes:
-            fig = comparison_chart(symbols, quotes, "Watchlist Performance")
-            files.append(render_to_discord_file(fig, "watchlist_comparison.png"))
+            files.append(await _render_cached(
+                "comparison", quotes,
+                lambda: comparison_chart(symbols, quotes, "Watchlist Performance"),
+                "watchlist_comparison.png", CACHE_TTL["quote"],
+            ))
 
         return files
 
@@ -44,8 +80,10 @@ class DashboardGenerator:
         try:
             sectors = await self.dm.get_sector_performance()
             if sectors:
-                fig = sector_heatmap(sectors)
-                files.append(render_to_discord_file(fig, "sector_heatmap.png"))
+                files.append(await _render_cached(
+                    "sector_heatmap", sectors, lambda: sector_heatmap(sectors),
+                    "sector_heatmap.png", CACHE_TTL["fundamentals"],
+                ))
         except Exception as e:
             log.error("sector_dashboard_error", error=str(e))
 
@@ -60,8 +98,10 @@ class DashboardGenerator:
         try:
             earnings = await self.dm.get_earnings(symbol)
             if earnings:
-                fig = earnings_chart(symbol, earnings)
-                files.append(render_to_discord_file(fig, f"{symbol}_earnings.png"))
+                files.append(await _render_cached(
+                    f"earnings:{symbol}", earnings, lambda: earnings_chart(symbol, earnings),
+                    f"{symbol}_earnings.png", CACHE_TTL["earnings"],
+                ))
         except Exception as e:
             log.error("earnings_dashboard_error", symbol=symbol, error=str(e))
 
@@ -76,8 +116,10 @@ class DashboardGenerator:
         try:
             data = await self.dm.fred.get_series(series_id, limit=30)
             if data:
-                fig = macro_trend_chart(series_name, data)
-                files.append(render_to_discord_file(fig, f"{series_id}_trend.png"))
+                files.append(await _render_cached(
+                    f"macro:{series_id}:{series_name}", data, lambda: macro_trend_chart(series_name, data),
+                    f"{series_id}_trend.png", CACHE_TTL["macro"],
+                ))
         except Exception as e:
             log.error("macro_dashboard_error", series_id=series_id, error=str(e))
 
@@ -89,8 +131,10 @@ class DashboardGenerator:
         try:
             prices = await self.dm.get_historical_prices(symbol, limit=90)
             if prices:
-                fig = price_chart(symbol, prices, title)
-                files.append(render_to_discord_file(fig, f"{symbol}_price.png"))
+                files.append(await _render_cached(
+                    f"price:{symbol}:{title}", prices, lambda: price_chart(symbol, prices, title),
+                    f"{symbol}_price.png", CACHE_TTL["quote"],
+                ))
         except Exception as e:
             log.error("price_chart_error", symbol=symbol, error=str(e))
         return files
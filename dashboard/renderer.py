@@ -1,5 +1,6 @@
 """Plotly figure to PNG rendering via Kaleido for Discord."""
 
+import asyncio
 import io
 import discord
 import plotly.graph_objects as go
@@ -17,3 +18,8 @@ def render_to_discord_file(fig: go.Figure, filename: str = "chart.png") -> disco
     """Render a Plotly figure and wrap in a discord.File."""
     image_bytes = render_to_bytes(fig)
     return discord.File(io.BytesIO(image_bytes), filename=filename)
+
+
+async def render_to_bytes_async(fig: go.Figure, format: str = "png") -> bytes:
+    """Render off the event loop — Kaleido blocks for hundreds of ms per chart."""
+    return await asyncio.to_thread(render_to_bytes, fig, format)
@@ -1,42 +1,85 @@
 """In-memory TTL cache."""
 
+import heapq
+import itertools
 import time
+from collections import OrderedDict
+from collections.abc import Hashable
 from typing import Any
 
+DEFAULT_MAX_SIZE = 10_000
+
+# Keys are usually tuples like ("quote", "AAPL") — cheaper to build and hash than formatted strings
+CacheKey = Hashable
+
 
 class TTLCache:
-    """Simple in-memory cache with per-key TTL."""
+    """In-memory cache with per-key TTL and an LRU size cap."""
 
-    def __init__(self) -> None:
-        self._store: dict[str, tuple[Any, float]] = {}
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        # key -> (value, expires_at, fresh_until); fresh_until < expires_at only for
+        # entries set with a stale grace period
+        self._store: OrderedDict[CacheKey, tuple[Any, float, float]] = OrderedDict()
+        self._max_size = max_size
+        # Min-heap of (expires_at, seq, key) so cleanup only touches expired entries.
+        # seq breaks ties so keys themselves are never compared.
+        # Re-set keys leave stale heap entries behind; cleanup skips them.
+        self._expiry: list[tuple[float, int, CacheKey]] = []
+        self._seq = itertools.count()
 
-    def get(self, key: str) -> Any | None:
+    def get(self, key: CacheKey) -> Any | None:
         """Get a cached value, or None if expired/missing."""
+        entry = self._lookup(key)
+        if entry is None or time.monotonic() > entry[2]:
+            return None
+        return entry[0]
+
+    def get_stale(self, key: CacheKey) -> Any | None:
+        """Get a cached value even if past its TTL, as long as its stale grace hasn't run out."""
+        entry = self._lookup(key)
+        return None if entry is None else entry[0]
+
+    def _lookup(self, key: CacheKey) -> tuple[Any, float, float] | None:
         entry = self._store.get(key)
         if entry is None:
             return None
-        value, expires_at = entry
-        if time.time() > expires_at:
+        if time.monotonic() > entry[1]:
             del self._store[key]
             return None
-        return value
+        self._store.move_to_end(key)
+        return entry
+
+    def set(self, key: CacheKey, value: Any, ttl: int, stale: int = 0) -> None:
+        """Set a value with TTL in seconds.
 
-    def set(self, key: str, value: Any, ttl: int) -> None:
-        """Set a value with TTL in seconds."""
-        self._store[key] = (value, time.time() + ttl)
+        ``stale`` keeps the entry around for that many extra seconds, readable
+        only through ``get_stale``.
+        """
+        fresh_until = time.monotonic() + ttl
+        expires_at = fresh_until + stale
+        self._store[key] = (value, expires_at, fresh_until)
+        self._store.move_to_end(key)
+        heapq.heappush(self._expiry, (expires_at, next(self._seq), key))
+        while len(self._store) > self._max_size:
+            self._store.popitem(last=False)
 
-    def delete(self, key: str) -> None:
+    def delete(self, key: CacheKey) -> None:
         """Remove a key."""
         self._store.pop(key, None)
 
     def clear(self) -> None:
         """Clear all entries."""
         self._store.clear()
+        self._expiry.clear()
 
     def cleanup(self) -> int:
         """Remove expired entries. Returns count of removed entries."""
-        now = time.time()
-        expired = [k for k, (_, exp) in self._store.items() if now > exp]
-        for k in expired:
-            del self._store[k]
-        return len(expired)
+        now = time.monotonic()
+        removed = 0
+        while self._expiry and self._expiry[0][0] < now:
+            expires_at, _, key = heapq.heappop(self._expiry)
+            entry = self._store.get(key)
+            if entry is not None and entry[1] == expires_at:
+                del self._store[key]
+                removed += 1
+        return removed
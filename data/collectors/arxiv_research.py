@@ -1,8 +1,9 @@
 """arXiv quantitative finance research paper collector."""
 
-import xml.etree.ElementTree as ET
+from io import BytesIO
 from typing import Any
 import structlog
+from lxml import etree
 from data.collectors.base import BaseCollector
 from data.rate_limiter import RateLimiter
 
@@ -31,6 +32,17 @@ AI_CATEGORIES = [
     "cs.NE",   # Neural and Evolutionary Computing
 ]
 
+# OR-clauses for the fixed category sets, built once instead of per search
+_QFIN_CAT_CLAUSE = "(" + " OR ".join(f"cat:{c}" for c in QFIN_CATEGORIES) + ")"
+_AI_CAT_CLAUSE = "(" + " OR ".join(f"cat:{c}" for c in AI_CATEGORIES) + ")"
+_CATEGORY_CLAUSES = {
+    tuple(QFIN_CATEGORIES): _QFIN_CAT_CLAUSE,
+    tuple(AI_CATEGORIES): _AI_CAT_CLAUSE,
+}
+
+_NS = {"atom": "http://www.w3.org/2005/Atom", "arxiv": "http://arxiv.org/schemas/atom"}
+_ENTRY_TAG = "{http://www.w3.org/2005/Atom}entry"
+
 
 class ArxivCollector(BaseCollector):
     api_name = "arxiv"
@@ -55,17 +67,14 @@ class ArxivCollector(BaseCollector):
         sort_by: str = "submittedDate",
     ) -> list[dict[str, Any]]:
         """Search arXiv for quantitative finance papers."""
-        search_parts = []
-        if query:
-            search_parts.append(f"all:{query}")
         if categories:
-            cat_query = " OR ".join(f"cat:{c}" for c in categories)
-            search_parts.append(f"({cat_query})")
+            cat_clause = _CATEGORY_CLAUSES.get(tuple(categories))
+            if cat_clause is None:
+                cat_clause = "(" + " OR ".join(f"cat:{c}" for c in categories) + ")"
         else:
-            cat_query = " OR ".join(f"cat:{c}" for c in QFIN_CATEGORIES)
-            search_parts.append(f"({cat_query})")
+            cat_clause = _QFIN_CAT_CLAUSE
 
-        search_query = " AND ".join(search_parts) if search_parts else "cat:q-fin.GN"
+        search_query = f"all:{query} AND {cat_clause}" if query else cat_clause
 
         await self.rate_limiter.acquire(self.api_name)
         session = await self.get_session()
@@ -78,9 +87,9 @@ class ArxivCollector(BaseCollector):
                 "sortOrder": "descending",
             },
         ) as resp:
-            text = await resp.text()
+            body = await resp.read()
 
-        return self._parse_atom_feed(text)
+        return self._parse_atom_feed(body)
 
     async def get_recent_papers(self, max_results: int = 20) -> list[dict[str, Any]]:
         """Get the most recent q-fin papers."""
@@ -103,45 +112,56 @@ class ArxivCollector(BaseCollector):
             max_results=max_results,
         )
 
-    def _parse_atom_feed(self, xml_text: str) -> list[dict[str, Any]]:
-        """Parse arXiv Atom feed into structured data."""
-        ns = {"atom": "http://www.w3.org/2005/Atom", "arxiv": "http://arxiv.org/schemas/atom"}
+    def _parse_atom_feed(self, xml_bytes: bytes) -> list[dict[str, Any]]:
+        """Stream-parse arXiv Atom feed (raw bytes) into structured data.
+
+        Each <entry> is converted and then cleared, along with already-processed
+        siblings, so peak memory stays flat regardless of max_results.
+        """
         papers = []
 
         try:
-            root = ET.fromstring(xml_text)
-            for entry in root.findall("atom:entry", ns):
-                title = entry.findtext("atom:title", "", ns).strip().replace("\n", " ")
-                summary = entry.findtext("atom:summary", "", ns).strip().replace("\n", " ")
-                published = entry.findtext("atom:published", "", ns)
-                arxiv_id = entry.findtext("atom:id", "", ns)
-
-                authors = [
-                    a.findtext("atom:name", "", ns)
-                    for a in entry.findall("atom:author", ns)
-                ]
-
-                categories = [
-                    c.get("term", "")
-                    for c in entry.findall("atom:category", ns)
-                ]
-
-                pdf_link = ""
-                for link in entry.findall("atom:link", ns):
-                    if link.get("title") == "pdf":
-                        pdf_link = link.get("href", "")
-                        break
-
-                papers.append({
-                    "title": title,
-                    "summary": summary,
-                    "authors": authors,
-                    "published": published,
-                    "arxiv_id": arxiv_id,
-                    "pdf_url": pdf_link,
-                    "categories": categories,
-                })
-        except ET.ParseError as e:
+            for _, entry in etree.iterparse(BytesIO(xml_bytes), events=("end",), tag=_ENTRY_TAG):
+                papers.append(self._entry_to_dict(entry))
+                entry.clear()
+                while entry.getprevious() is not None:
+                    del entry.getparent()[0]
+        except etree.XMLSyntaxError as e:
             log.error("arxiv_parse_error", error=str(e))
 
         return papers
+
+    @staticmethod
+    def _entry_to_dict(entry: Any) -> dict[str, Any]:
+        """Convert a single Atom <entry> element into a paper dict."""
+        ns = _NS
+        title = entry.findtext("atom:title", "", ns).strip().replace("\n", " ")
+        summary = entry.findtext("atom:summary", "", ns).strip().replace("\n", " ")
+        published = entry.findtext("atom:published", "", ns)
+        arxiv_id = entry.findtext("atom:id", "", ns)
+
+        authors = [
+            a.findtext("atom:name", "", ns)
+            for a in entry.findall("atom:author", ns)
+        ]
+
+        categories = [
+            c.get("term", "")
+            for c in entry.findall("atom:category", ns)
+        ]
+
+        pdf_link = ""
+        for link in entry.findall("atom:link", ns):
+            if link.get("title") == "pdf":
+                pdf_link = link.get("href", "")
+                break
+
+        return {
+            "title": title,
+            "summary": summary,
+            "authors": authors,
+            "published": published,
+            "arxiv_id": arxiv_id,
+            "pdf_url": pdf_link,
+            "categories": categories,
+        }
@@ -1,19 +1,84 @@
 """Base collector with retry, backoff, circuit breaker, and rate limiting."""
 
 import time
+import asyncio
 import aiohttp
+import orjson
 import structlog
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from typing import Any
-from urllib.parse import urlparse
+from yarl import URL
 from data.rate_limiter import RateLimiter
-from utils.retry import async_retry
+from utils.retry import RetryBudget, async_retry
 
 log = structlog.get_logger(__name__)
 
-# Circuit breaker: skip URLs that returned 403 for 1 hour
-_CIRCUIT_OPEN: dict[str, float] = {}  # url_path -> expiry timestamp
 _CIRCUIT_TTL = 3600.0  # 1 hour
+_CIRCUIT_MAX_SIZE = 1024
+
+
+# One process-wide session: a single connection pool, DNS cache and keep-alive
+# set shared by every collector instead of one per collector instance.
+_SESSION: aiohttp.ClientSession | None = None
+_POOL_LIMIT = 100
+_POOL_LIMIT_PER_HOST = 20
+_DNS_CACHE_TTL = 300  # seconds
+# Longer than the 60 s price-alert poll so FMP connections stay warm between
+# polls (aiohttp's default idle keep-alive is 15 s).
+_KEEPALIVE_TIMEOUT = 75.0
+_SESSION_LOCK = asyncio.Lock()
+
+
+async def get_shared_session() -> aiohttp.ClientSession:
+    """Return the shared ClientSession, creating it on first use."""
+    global _SESSION
+    if _SESSION is not None and not _SESSION.closed:
+        return _SESSION
+    async with _SESSION_LOCK:
+        if _SESSION is None or _SESSION.closed:
+            _SESSION = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=_POOL_LIMIT,
+                    limit_per_host=_POOL_LIMIT_PER_HOST,
+                    ttl_dns_cache=_DNS_CACHE_TTL,
+                    keepalive_timeout=_KEEPALIVE_TIMEOUT,
+                ),
+                # None of the upstream APIs use cookies; the default jar would
+                # still parse and schedule expiry for every Set-Cookie header.
+                cookie_jar=aiohttp.DummyCookieJar(),
+                timeout=aiohttp.ClientTimeout(total=30),
+                headers={"User-Agent": "ShaoBuffett/0.1 (Financial Agent)"},
+            )
+    return _SESSION
+
+
+async def close_shared_session() -> None:
+    """Close the shared ClientSession (call once at shutdown)."""
+    global _SESSION
+    if _SESSION is not None and not _SESSION.closed:
+        await _SESSION.close()
+    _SESSION = None
+
+
+async def prewarm_connections(urls: list[str], timeout: float = 3.0) -> None:
+    """Open pooled keep-alive connections to each URL's origin.
+
+    Sends a bodiless HEAD to the origin root (not an API endpoint, so no quota
+    is spent) so DNS resolution and the TLS handshake happen at startup rather
+    than on the first user-facing request. Failures are ignored.
+    """
+    session = await get_shared_session()
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+
+    async def head(origin: str) -> None:
+        async with session.head(origin, timeout=client_timeout, allow_redirects=False):
+            pass
+
+    origins = {str(URL(url).origin()) for url in urls}
+    results = await asyncio.gather(*(head(o) for o in origins), return_exceptions=True)
+    warmed = sum(1 for r in results if not isinstance(r, Exception))
+    log.info("collector_connections_prewarmed", hosts=len(origins), warmed=warmed)
 
 
 class NonRetryableError(Exception):
@@ -24,63 +89,243 @@ class NonRetryableError(Exception):
         super().__init__(message)
 
 
+class RateLimitedError(aiohttp.ClientError):
+    """HTTP 429 from the upstream; ``retry_after`` is the server's hint in seconds."""
+
+    def __init__(self, retry_after: float | None = None) -> None:
+        self.retry_after = retry_after
+        super().__init__("Rate limited")
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    # Only the delta-seconds form; HTTP-date hints fall back to computed backoff
+    try:
+        return max(0.0, float(value)) if value else None
+    except ValueError:
+        return None
+
+
+class CircuitBreaker:
+    """Per-endpoint breaker for auth/plan failures (401, 402, 403).
+
+    A tripped endpoint stays OPEN for ``ttl`` seconds, then goes HALF_OPEN:
+    exactly one probe request is let through. Any probe answer other than an
+    auth failure, 429 or 5xx closes the circuit; another auth failure re-opens it. Only tripped endpoints are
+    stored, capped at ``max_size`` with oldest-first eviction.
+    """
+
+    def __init__(self, ttl: float = _CIRCUIT_TTL, max_size: int = _CIRCUIT_MAX_SIZE) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self._open: OrderedDict[tuple[str, str], float] = OrderedDict()  # key -> reopen-at
+        self._probing: set[tuple[str, str]] = set()
+
+    def allow(self, key: tuple[str, str]) -> bool:
+        """Raise if the circuit is open; return True if this call is the half-open probe."""
+        retry_at = self._open.get(key)
+        if retry_at is None:
+            return False
+        if time.monotonic() < retry_at or key in self._probing:
+            raise NonRetryableError(403, f"Circuit open for {key[0]}:{key[1]}")
+        self._probing.add(key)
+        return True
+
+    def trip(self, key: tuple[str, str]) -> None:
+        self._probing.discard(key)
+        self._open[key] = time.monotonic() + self.ttl
+        self._open.move_to_end(key)
+        if len(self._open) > self.max_size:
+            self._open.popitem(last=False)
+
+    def reset(self, key: tuple[str, str]) -> None:
+        self._probing.discard(key)
+        self._open.pop(key, None)
+
+    def release(self, key: tuple[str, str]) -> None:
+        """End a probe that failed for an unrelated reason; the next call probes again."""
+        self._probing.discard(key)
+
+
+# Shared across collectors; touched only from the event loop thread, with no
+# await between check and update, so no lock is needed.
+_CIRCUIT = CircuitBreaker()
+
+# Conditional-GET cache for slow-changing endpoints (see _request(revalidate=True)):
+# (url, sorted params) -> (etag, last_modified, parsed body), oldest evicted first.
+_VALIDATED: OrderedDict[tuple[str, tuple[tuple[str, Any], ...]], tuple[str | None, str | None, Any]] = OrderedDict()
+_VALIDATED_MAX_SIZE = 512
+
+
+def _remember_validators(key: tuple[str, tuple[tuple[str, Any], ...]], resp_headers: Any, data: Any) -> None:
+    etag = resp_headers.get("ETag")
+    last_modified = resp_headers.get("Last-Modified")
+    if not (etag or last_modified):
+        _VALIDATED.pop(key, None)
+        return
+    _VALIDATED[key] = (etag, last_modified, data)
+    _VALIDATED.move_to_end(key)
+    if len(_VALIDATED) > _VALIDATED_MAX_SIZE:
+        _VALIDATED.popitem(last=False)
+
+
+# Retries per API are capped at 10% of its recent successes (min 3/minute)
+_RETRY_BUDGET = RetryBudget()
+
+# Singleflight: identical concurrent GETs share one in-flight fetch task
+_INFLIGHT: dict[tuple[Any, ...], asyncio.Task[Any]] = {}
+
+
+# Response shape helpers. Bodies come from orjson, which only ever builds plain
+# lists and dicts, so an exact type check is enough.
+def as_list(data: Any) -> list[Any]:
+    """Return ``data`` if the API answered with a JSON array, else []."""
+    return data if type(data) is list else []
+
+
+def first_item(data: Any) -> dict[str, Any]:
+    """Return the first element of a JSON array response, else {}."""
+    return data[0] if type(data) is list and data else {}
+
+
 class BaseCollector(ABC):
     """Abstract base class for all data collectors."""
 
     api_name: str = "unknown"
+    # Keyed collectors set this; an empty _api_key then fails fast in _validate_auth
+    requires_api_key: bool = False
+    _api_key: str = ""
 
     def __init__(self, rate_limiter: RateLimiter) -> None:
         self.rate_limiter = rate_limiter
-        self._session: aiohttp.ClientSession | None = None
+
+    def _validate_auth(self) -> None:
+        """Raise before spending a rate-limit slot on a request that can only 401."""
+        if self.requires_api_key and not self._api_key:
+            raise NonRetryableError(401, f"No API key configured for {self.api_name}")
 
     async def get_session(self) -> aiohttp.ClientSession:
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=30),
-                headers={"User-Agent": "ShaoBuffett/0.1 (Financial Agent)"},
-            )
-        return self._session
+        return await get_shared_session()
 
     async def close(self) -> None:
-        if self._session and not self._session.closed:
-            await self._session.close()
+        """No-op: the shared session is closed by close_shared_session()."""
 
-    @async_retry(max_retries=3, base_delay=1.0, exceptions=(aiohttp.ClientError, TimeoutError))
     async def _request(
         self,
         url: str,
         params: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
+        revalidate: bool = False,
+    ) -> dict[str, Any] | list[Any]:
+        """Make a rate-limited HTTP GET request with retry.
+
+        Identical requests issued while one is already in flight await that
+        request's result instead of spending another rate-limit slot.
+        """
+        self._validate_auth()
+        key = (
+            url,
+            tuple(sorted((params or {}).items())),
+            tuple(sorted((headers or {}).items())),
+        )
+        task = _INFLIGHT.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(url, params, headers, revalidate))
+            _INFLIGHT[key] = task
+
+            def _forget(done: asyncio.Task[Any]) -> None:
+                if _INFLIGHT.get(key) is done:
+                    del _INFLIGHT[key]
+
+            task.add_done_callback(_forget)
+        # Shielded so one caller being cancelled doesn't cancel the fetch for the others
+        return await asyncio.shield(task)
+
+    @async_retry(
+        max_retries=3,
+        base_delay=1.0,
+        exceptions=(aiohttp.ClientError, TimeoutError),
+        jitter=True,
+        budget=_RETRY_BUDGET,
+        budget_key=lambda self, *args, **kwargs: self.api_name,
+    )
+    async def _fetch(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        revalidate: bool = False,
     ) -> dict[str, Any] | list[Any]:
-        """Make a rate-limited HTTP GET request with retry."""
-        # Circuit breaker: skip URLs known to 403
-        url_path = f"{self.api_name}:{urlparse(url).path}"
-        if url_path in _CIRCUIT_OPEN:
-            if time.monotonic() < _CIRCUIT_OPEN[url_path]:
-                raise NonRetryableError(403, f"Circuit open for {url_path}")
-            else:
-                del _CIRCUIT_OPEN[url_path]
-
-        await self.rate_limiter.acquire(self.api_name)
-        session = await self.get_session()
-
-        async with session.get(url, params=params, headers=headers) as resp:
-            if resp.status == 429:
-                log.warning("rate_limited_by_server", api=self.api_name, url=url)
-                if self.rate_limiter.on_rate_limit:
-                    try:
-                        await self.rate_limiter.on_rate_limit(self.api_name, 0.0)
-                    except Exception:
-                        pass
-                raise aiohttp.ClientError("Rate limited")
-            if resp.status in (401, 402, 403):
-                log.warning("non_retryable_http_error", api=self.api_name, status=resp.status, url=url)
-                _CIRCUIT_OPEN[url_path] = time.monotonic() + _CIRCUIT_TTL
-                raise NonRetryableError(resp.status, f"HTTP {resp.status} for {url}")
-            if resp.status == 404:
-                raise NonRetryableError(resp.status, f"HTTP 404 for {url}")
-            resp.raise_for_status()
-            return await resp.json()
+        """Perform the GET behind _request: circuit breaker, rate limit, retry.
+
+        With ``revalidate=True`` the response's ETag/Last-Modified validators are
+        remembered and sent back on the next identical request; a 304 then
+        returns the previously parsed body without reading or decoding JSON.
+        """
+        # Circuit breaker: skip endpoints known to reject our credentials
+        circuit_key = (self.api_name, url.partition("?")[0])
+        probe = _CIRCUIT.allow(circuit_key)
+
+        cache_key = cached = None
+        if revalidate:
+            cache_key = (url, tuple(sorted((params or {}).items())))
+            cached = _VALIDATED.get(cache_key)
+            if cached is not None:
+                etag, last_modified, _ = cached
+                headers = dict(headers or {})
+                if etag:
+                    headers["If-None-Match"] = etag
+                if last_modified:
+                    headers["If-Modified-Since"] = last_modified
+
+        try:
+            await self.rate_limiter.acquire(self.api_name)
+            session = await self.get_session()
+
+            async with session.get(url, params=params, headers=headers) as resp:
+                if probe and resp.status < 500 and resp.status not in (401, 402, 403, 429):
+                    # Any answer short of an auth failure, throttle or server error
+                    # (a 404 included) proves the endpoint accepts us again
+                    _CIRCUIT.reset(circuit_key)
+                    probe = False
+                if resp.status == 429:
+                    log.warning("rate_limited_by_server", api=self.api_name, url=url)
+                    if self.rate_limiter.on_rate_limit:
+                        try:
+                            await self.rate_limiter.on_rate_limit(self.api_name, 0.0)
+                        except Exception:
+                            pass
+                    raise RateLimitedError(_parse_retry_after(resp.headers.get("Retry-After")))
+                if resp.status in (401, 402, 403):
+                    log.warning("non_retryable_http_error", api=self.api_name, status=resp.status, url=url)
+                    _CIRCUIT.trip(circuit_key)
+                    raise NonRetryableError(resp.status, f"HTTP {resp.status} for {url}")
+                if resp.status == 404:
+                    raise NonRetryableError(resp.status, f"HTTP 404 for {url}")
+                if resp.status == 304 and cached is not None:
+                    _VALIDATED.move_to_end(cache_key)
+                    data = cached[2]
+                else:
+                    resp.raise_for_status()
+                    # orjson parses straight from bytes, skipping the str decode resp.json() does
+                    body = await resp.read()
+                    if not body or body.isspace():
+                        data = None
+                    else:
+                        try:
+                            data = orjson.loads(body)
+                        except orjson.JSONDecodeError as e:
+                            # e.g. an HTML error page with a 200; keep it retryable like resp.json()'s error
+                            raise aiohttp.ContentTypeError(
+                                resp.request_info, resp.history, status=resp.status,
+                                message=f"Non-JSON response from {self.api_name}",
+                            ) from e
+                    if cache_key is not None:
+                        _remember_validators(cache_key, resp.headers, data)
+        except BaseException:
+            if probe:
+                _CIRCUIT.release(circuit_key)
+            raise
+        return data
 
     @abstractmethod
     async def health_check(self) -> bool:
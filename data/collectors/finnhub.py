@@ -1,10 +1,12 @@
 """Finnhub data collector — quotes, analyst ratings, earnings, news, insider trades."""
 
-import json
+import asyncio
+from types import MappingProxyType
 from typing import Any
+import orjson
 import structlog
 import websockets
-from data.collectors.base import BaseCollector
+from data.collectors.base import BaseCollector, as_list
 from data.rate_limiter import RateLimiter
 from config.settings import settings
 
@@ -15,20 +17,22 @@ BASE_URL = "https://finnhub.io/api/v1"
 
 class FinnhubCollector(BaseCollector):
     api_name = "finnhub"
+    requires_api_key = True
 
     def __init__(self, rate_limiter: RateLimiter) -> None:
         super().__init__(rate_limiter)
         self._api_key = settings.finnhub_api_key
+        self._base_params = MappingProxyType({"token": self._api_key})
         self._ws: Any = None
         self._ws_callbacks: dict[str, Any] = {}
 
     def _params(self, **kwargs: Any) -> dict[str, Any]:
-        return {"token": self._api_key, **kwargs}
+        return self._base_params | kwargs
 
     async def health_check(self) -> bool:
         try:
             data = await self._request(f"{BASE_URL}/stock/symbol", params=self._params(exchange="US"))
-            return isinstance(data, list) and len(data) > 0
+            return bool(as_list(data))
         except Exception:
             return False
 
@@ -56,7 +60,7 @@ class FinnhubCollector(BaseCollector):
         data = await self._request(
             f"{BASE_URL}/stock/recommendation", params=self._params(symbol=symbol)
         )
-        return data if isinstance(data, list) else []
+        return as_list(data)
 
     async def get_price_target(self, symbol: str) -> dict[str, Any]:
         """Get analyst price target consensus."""
@@ -67,7 +71,7 @@ class FinnhubCollector(BaseCollector):
         data = await self._request(
             f"{BASE_URL}/stock/earnings", params=self._params(symbol=symbol)
         )
-        return data if isinstance(data, list) else []
+        return as_list(data)
 
     async def get_company_news(self, symbol: str, from_date: str, to_date: str) -> list[dict[str, Any]]:
         """Get company news articles."""
@@ -75,14 +79,14 @@ class FinnhubCollector(BaseCollector):
             f"{BASE_URL}/company-news",
             params=self._params(symbol=symbol, **{"from": from_date, "to": to_date}),
         )
-        return data if isinstance(data, list) else []
+        return as_list(data)
 
     async def get_general_news(self, category: str = "general") -> list[dict[str, Any]]:
         """Get general market news."""
         data = await self._request(
             f"{BASE_URL}/news", params=self._params(category=category)
         )
-        return data if isinstance(data, list) else []
+        return as_list(data)
 
     async def get_insider_transactions(self, symbol: str) -> dict[str, Any]:
         """Get insider transactions."""
@@ -102,7 +106,7 @@ class FinnhubCollector(BaseCollector):
         data = await self._request(
             f"{BASE_URL}/stock/upgrade-downgrade", params=self._params(symbol=symbol)
         )
-        return data if isinstance(data, list) else []
+        return as_list(data)
 
     # WebSocket for real-time prices
     async def start_websocket(self, symbols: list[str], callback: Any) -> None:
@@ -113,30 +117,36 @@ class FinnhubCollector(BaseCollector):
 
         uri = f"wss://ws.finnhub.io?token={self._api_key}"
         try:
-            self._ws = await websockets.connect(uri)
+            # Trade frames are small and frequent: per-message deflate costs
+            # more CPU than it saves in bandwidth.
+            self._ws = await websockets.connect(uri, compression=None)
+            messages = [orjson.dumps({"type": "subscribe", "symbol": s}).decode() for s in symbols]
+            await asyncio.gather(*(self._ws.send(m) for m in messages))
             for symbol in symbols:
-                await self._ws.send(json.dumps({"type": "subscribe", "symbol": symbol}))
                 self._ws_callbacks[symbol] = callback
 
             log.info("finnhub_ws_connected", symbols=len(symbols))
 
+            callbacks = self._ws_callbacks
             async for message in self._ws:
-                data = json.loads(message)
+                data = orjson.loads(message)
                 if data.get("type") == "trade":
-                    for trade in data.get("data", []):
-                        sym = trade.get("s")
-                        if sym in self._ws_callbacks:
-                            await self._ws_callbacks[sym](trade)
+                    await asyncio.gather(*(
+                        cb(trade) for trade in data.get("data") or ()
+                        if (cb := callbacks.get(trade.get("s")))
+                    ))
         except Exception as e:
             log.error("finnhub_ws_error", error_type=type(e).__name__)
 
     async def stop_websocket(self) -> None:
         if self._ws:
-            for symbol in self._ws_callbacks:
-                try:
-                    await self._ws.send(json.dumps({"type": "unsubscribe", "symbol": symbol}))
-                except Exception:
-                    pass
+            await asyncio.gather(
+                *(
+                    self._ws.send(orjson.dumps({"type": "unsubscribe", "symbol": s}).decode())
+                    for s in self._ws_callbacks
+                ),
+                return_exceptions=True,
+            )
             await self._ws.close()
             self._ws = None
             self._ws_callbacks.clear()
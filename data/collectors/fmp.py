@@ -3,9 +3,12 @@
 Uses the /stable/ API (v3 endpoints were deprecated August 2025).
 """
 
+import asyncio
+from datetime import date, timedelta
+from types import MappingProxyType
 from typing import Any
 import structlog
-from data.collectors.base import BaseCollector
+from data.collectors.base import BaseCollector, as_list, first_item
 from data.rate_limiter import RateLimiter
 from config.settings import settings
 
@@ -13,23 +16,28 @@ log = structlog.get_logger(__name__)
 
 BASE_URL = "https://financialmodelingprep.com/stable"
 
+# Max in-flight per-sector requests in get_sector_performance
+_SECTOR_CONCURRENCY = 8
+
 
 class FMPCollector(BaseCollector):
     api_name = "fmp"
+    requires_api_key = True
 
     def __init__(self, rate_limiter: RateLimiter) -> None:
         super().__init__(rate_limiter)
         self._api_key = settings.fmp_api_key
+        self._base_params = MappingProxyType({"apikey": self._api_key})
 
     def _params(self, **kwargs: Any) -> dict[str, Any]:
-        return {"apikey": self._api_key, **kwargs}
+        return self._base_params | kwargs
 
     async def health_check(self) -> bool:
         try:
             data = await self._request(
                 f"{BASE_URL}/quote", params=self._params(symbol="AAPL")
             )
-            return isinstance(data, list) and len(data) > 0
+            return bool(as_list(data))
         except Exception:
             return False
 
@@ -38,30 +46,32 @@ class FMPCollector(BaseCollector):
         data = await self._request(
             f"{BASE_URL}/quote", params=self._params(symbol=symbol)
         )
-        return data[0] if isinstance(data, list) and data else {}
+        return first_item(data)
 
     async def get_profile(self, symbol: str) -> dict[str, Any]:
         """Get company profile with fundamentals."""
         data = await self._request(
-            f"{BASE_URL}/profile", params=self._params(symbol=symbol)
+            f"{BASE_URL}/profile", params=self._params(symbol=symbol), revalidate=True
         )
-        return data[0] if isinstance(data, list) and data else {}
+        return first_item(data)
 
     async def get_income_statement(self, symbol: str, limit: int = 4) -> list[dict[str, Any]]:
         """Get income statements."""
         data = await self._request(
             f"{BASE_URL}/income-statement",
             params=self._params(symbol=symbol, limit=limit, period="annual"),
+            revalidate=True,
         )
-        return data if isinstance(data, list) else []
+        return as_list(data)
 
     async def get_balance_sheet(self, symbol: str, limit: int = 4) -> list[dict[str, Any]]:
         """Get balance sheets."""
         data = await self._request(
             f"{BASE_URL}/balance-sheet-statement",
             params=self._params(symbol=symbol, limit=limit, period="annual"),
+            revalidate=True,
         )
-        return data if isinstance(data, list) else []
+        return as_list(data)
 
     async def get_key_metrics(self, symbol: str, limit: int = 4) -> list[dict[str, Any]]:
         """Get key financial metrics (PE, ROE, margins, etc.)."""
@@ -69,7 +79,7 @@ class FMPCollector(BaseCollector):
             f"{BASE_URL}/key-metrics",
             params=self._params(symbol=symbol, limit=limit, period="annual"),
         )
-        return data if isinstance(data, list) else []
+        return as_list(data)
 
     async def get_ratios(self, symbol: str, limit: int = 4) -> list[dict[str, Any]]:
         """Get financial ratios."""
@@ -77,7 +87,7 @@ class FMPCollector(BaseCollector):
             f"{BASE_URL}/ratios",
             params=self._params(symbol=symbol, limit=limit, period="annual"),
         )
-        return data if isinstance(data, list) else []
+        return as_list(data)
 
     async def get_analyst_estimates(self, symbol: str) -> list[dict[str, Any]]:
         """Get analyst estimates."""
@@ -85,7 +95,7 @@ class FMPCollector(BaseCollector):
             f"{BASE_URL}/analyst-estimates",
             params=self._params(symbol=symbol, period="annual"),
         )
-        return data if isinstance(data, list) else []
+        return as_list(data)
 
     async def get_earnings_transcript(self, symbol: str, year: int, quarter: int) -> dict[str, Any]:
         """Get earnings call transcript."""
@@ -103,7 +113,7 @@ class FMPCollector(BaseCollector):
             f"{BASE_URL}/earning-call-transcript",
             params=self._params(symbol=symbol),
         )
-        return data if isinstance(data, list) else []
+        return as_list(data)
 
     async def get_sector_performance(self) -> list[dict[str, Any]]:
         """Get sector performance data via historical endpoint."""
@@ -114,21 +124,23 @@ class FMPCollector(BaseCollector):
             "Consumer Cyclical", "Industrials", "Communication Services",
             "Consumer Defensive", "Utilities", "Real Estate", "Basic Materials",
         ]
-        results = []
-        for sector in sectors:
-            try:
-                data = await self._request(
+        sem = asyncio.Semaphore(_SECTOR_CONCURRENCY)
+
+        async def fetch(sector: str) -> dict[str, Any] | list[Any]:
+            async with sem:
+                return await self._request(
                     f"{BASE_URL}/historical-sector-performance",
                     params=self._params(sector=sector),
                 )
-                if isinstance(data, list) and data:
-                    latest = data[0]
-                    results.append({
-                        "sector": sector,
-                        "changesPercentage": latest.get("changesPercentage", 0),
-                    })
-            except Exception:
-                continue
+
+        responses = await asyncio.gather(*(fetch(s) for s in sectors), return_exceptions=True)
+        results = []
+        for sector, data in zip(sectors, responses):
+            if isinstance(data, list) and data:
+                results.append({
+                    "sector": sector,
+                    "changesPercentage": data[0].get("changesPercentage", 0),
+                })
         return results
 
     async def get_dcf(self, symbol: str) -> dict[str, Any]:
@@ -146,9 +158,7 @@ class FMPCollector(BaseCollector):
         data = await self._request(
             f"{BASE_URL}/stock-peers", params=self._params(symbol=symbol)
         )
-        if isinstance(data, list):
-            return [p["symbol"] for p in data if "symbol" in p]
-        return []
+        return [p["symbol"] for p in as_list(data) if "symbol" in p]
 
     async def get_technical_indicator(
         self, symbol: str, indicator_type: str, period: int = 14, limit: int = 1
@@ -158,16 +168,15 @@ class FMPCollector(BaseCollector):
             f"{BASE_URL}/technical-indicators/{indicator_type}",
             params=self._params(symbol=symbol, periodLength=period, timeframe="1day"),
         )
-        if isinstance(data, list):
-            return data[:limit]
-        return []
+        return as_list(data)[:limit]
 
     async def get_historical_price(self, symbol: str, limit: int = 90) -> list[dict[str, Any]]:
         """Get historical daily price data (OHLCV)."""
+        # Without a range FMP returns ~5 years of rows; ask only for enough
+        # calendar days to cover `limit` trading days (weekends + holidays).
+        since = date.today() - timedelta(days=limit * 3 // 2 + 10)
         data = await self._request(
             f"{BASE_URL}/historical-price-eod/full",
-            params=self._params(symbol=symbol),
+            params=self._params(symbol=symbol, **{"from": since.isoformat()}),
         )
-        if isinstance(data, list):
-            return data[:limit]
-        return []
+        return as_list(data)[:limit]
@@ -1,5 +1,7 @@
 """FRED (Federal Reserve Economic Data) collector."""
 
+import asyncio
+from types import MappingProxyType
 from typing import Any
 import structlog
 from data.collectors.base import BaseCollector
@@ -33,17 +35,24 @@ MACRO_SERIES = {
     "Housing Starts": "HOUST",
     "M2 Money Supply": "M2SL",
 }
+# Snapshot iteration order, fixed once so requests and results zip back together
+_MACRO_ITEMS: tuple[tuple[str, str], ...] = tuple(MACRO_SERIES.items())
+
+# Max in-flight series requests per snapshot (the rate limiter still paces them)
+_SNAPSHOT_CONCURRENCY = 8
 
 
 class FredCollector(BaseCollector):
     api_name = "fred"
+    requires_api_key = True
 
     def __init__(self, rate_limiter: RateLimiter) -> None:
         super().__init__(rate_limiter)
         self._api_key = settings.fred_api_key
+        self._base_params = MappingProxyType({"api_key": self._api_key, "file_type": "json"})
 
     def _params(self, **kwargs: Any) -> dict[str, Any]:
-        return {"api_key": self._api_key, "file_type": "json", **kwargs}
+        return self._base_params | kwargs
 
     async def health_check(self) -> bool:
         try:
@@ -68,13 +77,14 @@ class FredCollector(BaseCollector):
                 limit=limit,
                 sort_order=sort_order,
             ),
+            revalidate=True,
         )
         return data.get("observations", [])
 
     async def get_series_info(self, series_id: str) -> dict[str, Any]:
         """Get metadata about a FRED series."""
         data = await self._request(
-            f"{BASE_URL}/series", params=self._params(series_id=series_id)
+            f"{BASE_URL}/series", params=self._params(series_id=series_id), revalidate=True
         )
         seriess = data.get("seriess", [])
         return seriess[0] if seriess else {}
@@ -89,16 +99,25 @@ class FredCollector(BaseCollector):
 
     async def get_macro_snapshot(self) -> dict[str, Any]:
         """Get latest values for key macro indicators."""
+        sem = asyncio.Semaphore(_SNAPSHOT_CONCURRENCY)
+
+        async def fetch(series_id: str) -> list[dict[str, Any]]:
+            async with sem:
+                return await self.get_series(series_id, limit=1)
+
+        results = await asyncio.gather(
+            *(fetch(series_id) for _, series_id in _MACRO_ITEMS),
+            return_exceptions=True,
+        )
         snapshot = {}
-        for name, series_id in MACRO_SERIES.items():
-            try:
-                obs = await self.get_series(series_id, limit=1)
-                if obs:
-                    snapshot[name] = {
-                        "value": obs[0].get("value"),
-                        "date": obs[0].get("date"),
-                        "series_id": series_id,
-                    }
-            except Exception as e:
-                log.warning("fred_series_error", series_id=series_id, error=str(e))
+        for (name, series_id), obs in zip(_MACRO_ITEMS, results):
+            if isinstance(obs, BaseException):
+                log.warning("fred_series_error", series_id=series_id, error=str(obs))
+                continue
+            if obs:
+                snapshot[name] = {
+                    "value": obs[0].get("value"),
+                    "date": obs[0].get("date"),
+                    "series_id": series_id,
+                }
         return snapshot
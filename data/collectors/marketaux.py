@@ -1,5 +1,6 @@
 """MarketAux financial news collector with sentiment."""
 
+from types import MappingProxyType
 from typing import Any
 import structlog
 from data.collectors.base import BaseCollector
@@ -10,16 +11,28 @@ log = structlog.get_logger(__name__)
 
 BASE_URL = "https://api.marketaux.com/v1"
 
+# Sentiment timeline column -> (MarketAux field, default)
+_TIMELINE_FIELDS = {
+    "date": ("date", ""),
+    "articles": ("total_documents", 0),
+    "sentiment_avg": ("sentiment_avg", None),
+    "positive": ("doc_count_sentiment_positive", 0),
+    "negative": ("doc_count_sentiment_negative", 0),
+    "neutral": ("doc_count_sentiment_neutral", 0),
+}
+
 
 class MarketAuxCollector(BaseCollector):
     api_name = "marketaux"
+    requires_api_key = True
 
     def __init__(self, rate_limiter: RateLimiter) -> None:
         super().__init__(rate_limiter)
         self._api_key = settings.marketaux_api_key
+        self._base_params = MappingProxyType({"api_token": self._api_key})
 
     def _params(self, **kwargs: Any) -> dict[str, Any]:
-        return {"api_token": self._api_key, **kwargs}
+        return self._base_params | kwargs
 
     async def health_check(self) -> bool:
         try:
@@ -47,20 +60,23 @@ class MarketAuxCollector(BaseCollector):
         data = await self._request(f"{BASE_URL}/news/all", params=params)
         articles = data.get("data", [])
 
-        return [
-            {
+        out = []
+        for a in articles:
+            entities = a.get("entities") or ()
+            first = entities[0] if entities else None
+            out.append({
                 "title": a.get("title", ""),
                 "description": a.get("description", ""),
                 "snippet": a.get("snippet", ""),
                 "url": a.get("url", ""),
                 "source": a.get("source", ""),
                 "published_at": a.get("published_at", ""),
-                "symbols": [e.get("symbol") for e in a.get("entities", []) if e.get("symbol")],
-                "sentiment": a.get("entities", [{}])[0].get("sentiment_score") if a.get("entities") else None,
-                "relevance": a.get("entities", [{}])[0].get("match_score") if a.get("entities") else None,
-            }
-            for a in articles
-        ]
+                # Ordered dedupe: MarketAux often repeats a symbol across entities
+                "symbols": list(dict.fromkeys(sym for e in entities if (sym := e.get("symbol")))),
+                "sentiment": first.get("sentiment_score") if first else None,
+                "relevance": first.get("match_score") if first else None,
+            })
+        return out
 
     async def get_news_for_symbol(self, symbol: str, limit: int = 5) -> list[dict[str, Any]]:
         """Get news specifically for one symbol."""
@@ -123,21 +139,15 @@ class MarketAuxCollector(BaseCollector):
 
         result: dict[str, Any] = {}
         for entity in entities:
-            symbol = entity.get("key", "")
-            result[symbol] = {
+            # Columnar timeline: one list per field instead of a dict per point
+            timeline: dict[str, list[Any]] = {name: [] for name in _TIMELINE_FIELDS}
+            for point in entity.get("data", []):
+                for name, (field, default) in _TIMELINE_FIELDS.items():
+                    timeline[name].append(point.get(field, default))
+            result[entity.get("key", "")] = {
                 "name": entity.get("name", ""),
                 "total_documents": entity.get("total_documents", 0),
                 "sentiment_avg": entity.get("sentiment_avg"),
-                "timeline": [
-                    {
-                        "date": point.get("date", ""),
-                        "articles": point.get("total_documents", 0),
-                        "sentiment_avg": point.get("sentiment_avg"),
-                        "positive": point.get("doc_count_sentiment_positive", 0),
-                        "negative": point.get("doc_count_sentiment_negative", 0),
-                        "neutral": point.get("doc_count_sentiment_neutral", 0),
-                    }
-                    for point in entity.get("data", [])
-                ],
+                "timeline": timeline,
             }
         return result
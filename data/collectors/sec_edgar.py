@@ -14,6 +14,20 @@ SUBMISSIONS_URL = "https://data.sec.gov/submissions"
 TICKER_CIK_MAP: dict[str, str] = {}
 
 
+def _filing_from_hit(hit: dict[str, Any]) -> dict[str, Any]:
+    """Project one search-index hit onto the fields the bot uses."""
+    src = hit.get("_source") or {}
+    names = src.get("display_names")
+    return {
+        "form_type": src.get("form_type", ""),
+        "entity_name": src.get("entity_name", ""),
+        "file_date": src.get("file_date", ""),
+        "period_of_report": src.get("period_of_report", ""),
+        "file_url": f"https://www.sec.gov/Archives/edgar/data/{src.get('entity_id', '')}/{hit.get('_id', '')}",
+        "description": names[0] if names else "",
+    }
+
+
 class SECEdgarCollector(BaseCollector):
     api_name = "sec_edgar"
 
@@ -39,9 +53,9 @@ class SECEdgarCollector(BaseCollector):
                 "https://efts.sec.gov/LATEST/search-index",
                 params={"q": f"\"{symbol}\"", "dateRange": "custom", "startdt": "2024-01-01", "enddt": "2024-12-31", "forms": "10-K"},
             )
-            hits = data.get("hits", {}).get("hits", [])
+            hits = (data.get("hits") or {}).get("hits")
             if hits:
-                cik = hits[0].get("_source", {}).get("entity_id", "")
+                cik = (hits[0].get("_source") or {}).get("entity_id", "")
                 if cik:
                     TICKER_CIK_MAP[symbol] = cik
                     return cik
@@ -66,20 +80,10 @@ class SECEdgarCollector(BaseCollector):
             params["startdt"] = date_from
             params["enddt"] = date_to
 
-        data = await self._request(f"{BASE_URL}/search-index", params=params)
-        hits = data.get("hits", {}).get("hits", [])
-
-        return [
-            {
-                "form_type": h.get("_source", {}).get("form_type", ""),
-                "entity_name": h.get("_source", {}).get("entity_name", ""),
-                "file_date": h.get("_source", {}).get("file_date", ""),
-                "period_of_report": h.get("_source", {}).get("period_of_report", ""),
-                "file_url": f"https://www.sec.gov/Archives/edgar/data/{h.get('_source', {}).get('entity_id', '')}/{h.get('_id', '')}",
-                "description": h.get("_source", {}).get("display_names", [""])[0] if h.get("_source", {}).get("display_names") else "",
-            }
-            for h in hits
-        ]
+        # Filing lists change at most a few times a day; a 304 skips the body entirely
+        data = await self._request(f"{BASE_URL}/search-index", params=params, revalidate=True)
+        hits = (data.get("hits") or {}).get("hits") or ()
+        return [_filing_from_hit(h) for h in hits]
 
     async def get_company_filings(
         self,
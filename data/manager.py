@@ -1,31 +1,87 @@
 """Data manager — orchestrates collectors and cache."""
 
 import asyncio
-from typing import Any
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any, TypeVar
 import structlog
-from data.cache import TTLCache
+from data.cache import CacheKey, TTLCache
+from storage.repositories.cache_repo import CacheRepository
 from data.rate_limiter import RateLimiter
+from data.collectors import finnhub, fmp, fred, marketaux
 from data.collectors.finnhub import FinnhubCollector
 from data.collectors.fred import FredCollector
 from data.collectors.marketaux import MarketAuxCollector
 from data.collectors.fmp import FMPCollector
 from data.collectors.sec_edgar import SECEdgarCollector
 from data.collectors.arxiv_research import ArxivCollector
-from config.constants import API_RATE_LIMITS, CACHE_TTL, is_ai_related
+from data.collectors.base import close_shared_session, prewarm_connections
+from config.constants import (
+    API_RATE_LIMITS, CACHE_STALE_TTL, CACHE_TTL, RATE_LIMIT_ALGORITHMS, is_ai_related,
+)
 
 log = structlog.get_logger(__name__)
 
+T = TypeVar("T")
+
+# APIs polled continuously; their connections are opened at startup
+_PREWARM_URLS = [finnhub.BASE_URL, fmp.BASE_URL, fred.BASE_URL, marketaux.BASE_URL]
+
+# Max concurrent per-symbol Finnhub calls when batch news falls back
+_FALLBACK_CONCURRENCY = 8
+
+# Seconds before a health check counts as failed (arXiv routinely takes 1-3s)
+_HEALTH_CHECK_TIMEOUT = 5.0
+
+
+def _news_window() -> tuple[str, str]:
+    """(from, to) dates for Finnhub company-news fallbacks: the last two days."""
+    today = datetime.now(UTC).date()
+    return (today - timedelta(days=2)).isoformat(), today.isoformat()
+
+
+def _finnhub_article(a: dict[str, Any], symbols: list[str]) -> dict[str, Any]:
+    """Map a Finnhub news item onto the MarketAux article shape."""
+    summary = a.get("summary", "")
+    return {
+        "title": a.get("headline", ""),
+        "description": summary,
+        "snippet": summary[:200],
+        "url": a.get("url", ""),
+        "source": a.get("source", ""),
+        "published_at": a.get("datetime", ""),
+        "symbols": symbols,
+        "sentiment": None,
+        "relevance": None,
+    }
+
+
+def _persistent_key(key: CacheKey) -> str:
+    """Flatten a tuple cache key into the data_cache table's string key."""
+    parts = []
+    for part in key:
+        if part is None:
+            part = ""
+        elif isinstance(part, tuple):
+            part = ",".join(part)
+        parts.append(str(part))
+    return ":".join(parts)
+
 
 class DataManager:
     """Central orchestrator for all data collectors with caching."""
 
-    def __init__(self) -> None:
+    def __init__(self, persistent: CacheRepository | None = None) -> None:
         self.cache = TTLCache()
+        # Optional Postgres-backed second level for slow-changing data, so a
+        # restart doesn't refetch every profile, transcript and filing list
+        self.persistent = persistent
+        self._inflight: dict[CacheKey, asyncio.Task[Any]] = {}
         self.rate_limiter = RateLimiter()
 
         # Configure rate limits
         for api_name, limit in API_RATE_LIMITS.items():
-            self.rate_limiter.configure(api_name, limit)
+            self.rate_limiter.configure(api_name, limit, RATE_LIMIT_ALGORITHMS.get(api_name, "gcra"))
 
         # Initialize collectors
         self.finnhub = FinnhubCollector(self.rate_limiter)
@@ -38,18 +94,19 @@ class DataManager:
     async def start(self) -> None:
         """Initialize all collectors."""
         log.info("data_manager_starting")
+        await prewarm_connections(_PREWARM_URLS)
 
     async def close(self) -> None:
         """Close all collector sessions."""
         collectors = [self.finnhub, self.fred, self.marketaux, self.fmp, self.sec_edgar, self.arxiv]
-        for collector in collectors:
-            await collector.close()
+        # Concurrent, and one failing close doesn't skip the rest of shutdown
+        await asyncio.gather(*(collector.close() for collector in collectors), return_exceptions=True)
         await self.finnhub.stop_websocket()
+        await close_shared_session()
         log.info("data_manager_closed")
 
     async def health_check(self) -> dict[str, bool]:
-        """Check health of all APIs."""
-        results = {}
+        """Check health of all APIs (concurrently)."""
         checks = {
             "finnhub": self.finnhub,
             "fred": self.fred,
@@ -58,218 +115,265 @@ class DataManager:
             "sec_edgar": self.sec_edgar,
             "arxiv": self.arxiv,
         }
-        for name, collector in checks.items():
-            try:
-                results[name] = await collector.health_check()
-            except Exception:
-                results[name] = False
-        return results
+        # Bound each check so one hung API can't stall the whole report
+        results = await asyncio.gather(
+            *(asyncio.wait_for(c.health_check(), _HEALTH_CHECK_TIMEOUT) for c in checks.values()),
+            return_exceptions=True,
+        )
+        return {name: result is True for name, result in zip(checks, results)}
+
+    async def _cached(
+        self,
+        key: CacheKey,
+        ttl: int,
+        loader: Callable[[], Awaitable[T]],
+        stale: int = 0,
+        persist: bool = False,
+    ) -> T:
+        """Return the cached value for ``key``, or load, cache and return it.
+
+        Concurrent misses on the same key share one in-flight load, so N
+        callers cost one upstream fetch. Empty results are not cached.
+        With ``stale`` > 0, an expired value is served for up to that many
+        more seconds while a background load refreshes it. With ``persist``,
+        fresh loads are also written to ``self.persistent`` and a memory miss
+        checks it before going upstream.
+        """
+        cached = self.cache.get(key)
+        if cached:
+            return cached
+        if stale:
+            cached = self.cache.get_stale(key)
+            if cached:
+                refresh = self._load(key, ttl, loader, stale, persist)
+                refresh.add_done_callback(lambda done: self._log_refresh_failure(key, done))
+                return cached
+        if persist and self.persistent is not None:
+            stored = await self._read_persistent(key)
+            if stored:
+                # The stored expiry isn't carried over; the memory TTL restarts here
+                self.cache.set(key, stored, ttl, stale)
+                return stored
+        # Shielded so one caller being cancelled doesn't cancel the load for the others
+        return await asyncio.shield(self._load(key, ttl, loader, stale, persist))
+
+    def _load(
+        self,
+        key: CacheKey,
+        ttl: int,
+        loader: Callable[[], Awaitable[T]],
+        stale: int,
+        persist: bool = False,
+    ) -> asyncio.Task[T]:
+        """Start a load for ``key``, or join the one already in flight."""
+        task = self._inflight.get(key)
+        if task is None:
+            async def load() -> T:
+                data = await loader()
+                if data:
+                    self.cache.set(key, data, ttl, stale)
+                    if persist and self.persistent is not None:
+                        await self._write_persistent(key, data, ttl)
+                return data
+
+            task = asyncio.ensure_future(load())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget_inflight(key, done))
+        return task
+
+    async def _read_persistent(self, key: CacheKey) -> Any | None:
+        try:
+            return await self.persistent.get(_persistent_key(key))
+        except Exception as e:
+            log.warning("persistent_cache_read_failed", key=key, error=str(e))
+            return None
+
+    async def _write_persistent(self, key: CacheKey, data: Any, ttl: int) -> None:
+        try:
+            await self.persistent.set(_persistent_key(key), data, ttl)
+        except Exception as e:
+            log.warning("persistent_cache_write_failed", key=key, error=str(e))
+
+    def _forget_inflight(self, key: CacheKey, task: asyncio.Task[Any]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    @staticmethod
+    def _log_refresh_failure(key: CacheKey, task: asyncio.Task[Any]) -> None:
+        # A background refresh may have no awaiter, so surface its failure here
+        if not task.cancelled() and (error := task.exception()) is not None:
+            log.warning("cache_refresh_failed", key=key, error=str(error))
 
     # ── Cached data access methods ──
 
     async def get_quote(self, symbol: str) -> dict[str, Any]:
         """Get stock quote with caching. Uses FMP (saves Finnhub budget)."""
-        key = f"quote:{symbol}"
-        cached = self.cache.get(key)
-        if cached:
-            return cached
-        try:
-            data = await self.fmp.get_quote(symbol)
-        except Exception:
-            data = await self.finnhub.get_quote(symbol)
-        self.cache.set(key, data, CACHE_TTL["quote"])
-        return data
+        key = ("quote", symbol)
+
+        async def load() -> dict[str, Any]:
+            try:
+                data = await self.fmp.get_quote(symbol)
+            except Exception:
+                data = await self.finnhub.get_quote(symbol)
+            return data
+
+        return await self._cached(key, CACHE_TTL["quote"], load)
 
     async def get_company_profile(self, symbol: str) -> dict[str, Any]:
         """Get company profile with caching."""
-        key = f"profile:{symbol}"
-        cached = self.cache.get(key)
-        if cached:
-            return cached
-        # Try FMP first for richer data, fall back to Finnhub
-        try:
-            data = await self.fmp.get_profile(symbol)
-        except Exception:
-            data = await self.finnhub.get_company_profile(symbol)
-        self.cache.set(key, data, CACHE_TTL["profile"])
-        return data
+        key = ("profile", symbol)
+
+        async def load() -> dict[str, Any]:
+            # Try FMP first for richer data, fall back to Finnhub
+            try:
+                data = await self.fmp.get_profile(symbol)
+            except Exception:
+                data = await self.finnhub.get_company_profile(symbol)
+            return data
+
+        return await self._cached(key, CACHE_TTL["profile"], load, CACHE_STALE_TTL["profile"], persist=True)
+
+    async def get_stock_peers(self, symbol: str) -> list[str]:
+        """Get FMP peer symbols with caching (peer lists change on the order of weeks)."""
+        key = ("peers", symbol)
+        return await self._cached(
+            key, CACHE_TTL["peers"], lambda: self.fmp.get_stock_peers(symbol), persist=True,
+        )
 
     async def get_fundamentals(self, symbol: str) -> dict[str, Any]:
         """Get key financial metrics."""
-        key = f"fundamentals:{symbol}"
-        cached = self.cache.get(key)
-        if cached:
-            return cached
-        metrics, ratios = await asyncio.gather(
-            self.fmp.get_key_metrics(symbol, limit=1),
-            self.fmp.get_ratios(symbol, limit=1),
-            return_exceptions=True,
-        )
-        if isinstance(metrics, Exception):
-            metrics = []
-        if isinstance(ratios, Exception):
-            ratios = []
-        data = {
-            "metrics": metrics[0] if metrics else {},
-            "ratios": ratios[0] if ratios else {},
-        }
-        self.cache.set(key, data, CACHE_TTL["fundamentals"])
-        return data
+        key = ("fundamentals", symbol)
+
+        async def load() -> dict[str, Any]:
+            metrics, ratios = await asyncio.gather(
+                self.fmp.get_key_metrics(symbol, limit=1),
+                self.fmp.get_ratios(symbol, limit=1),
+                return_exceptions=True,
+            )
+            if isinstance(metrics, Exception):
+                metrics = []
+            if isinstance(ratios, Exception):
+                ratios = []
+            data = {
+                "metrics": metrics[0] if metrics else {},
+                "ratios": ratios[0] if ratios else {},
+            }
+            return data
+
+        return await self._cached(key, CACHE_TTL["fundamentals"], load, CACHE_STALE_TTL["fundamentals"])
 
     async def get_analyst_data(self, symbol: str) -> dict[str, Any]:
         """Get analyst recommendations (Finnhub)."""
-        key = f"analyst:{symbol}"
-        cached = self.cache.get(key)
-        if cached:
-            return cached
+        key = ("analyst", symbol)
+
+        async def load() -> dict[str, Any]:
+            # Finnhub: recommendations (free).
+            # upgrade-downgrade and price-target are Finnhub premium — skipped.
+            # FMP analyst-estimates requires paid plan (402) — skipped from polling.
+            recs = await self.finnhub.get_analyst_recommendations(symbol)
+            data = {
+                "recommendations": (recs[:5] if isinstance(recs, list) else []),
+                "estimates": [],
+                "upgrades_downgrades": [],
+            }
+            return data
 
-        # Finnhub: recommendations (free).
-        # upgrade-downgrade and price-target are Finnhub premium — skipped.
-        # FMP analyst-estimates requires paid plan (402) — skipped from polling.
-        recs = await self.finnhub.get_analyst_recommendations(symbol)
-        data = {
-            "recommendations": (recs[:5] if isinstance(recs, list) else []),
-            "estimates": [],
-            "upgrades_downgrades": [],
-        }
-        self.cache.set(key, data, CACHE_TTL["analyst"])
-        return data
+        return await self._cached(key, CACHE_TTL["analyst"], load)
 
     async def get_earnings(self, symbol: str) -> list[dict[str, Any]]:
         """Get earnings history. Falls back Finnhub → FMP."""
-        key = f"earnings:{symbol}"
-        cached = self.cache.get(key)
-        if cached:
-            return cached
-        try:
-            data = await self.finnhub.get_earnings(symbol)
-        except Exception:
-            data = []
-        self.cache.set(key, data, CACHE_TTL["earnings"])
-        return data
+        key = ("earnings", symbol)
+
+        async def load() -> list[dict[str, Any]]:
+            try:
+                data = await self.finnhub.get_earnings(symbol)
+            except Exception:
+                data = []
+            return data
+
+        return await self._cached(key, CACHE_TTL["earnings"], load)
 
     async def get_news(
         self, symbol: str | None = None, limit: int = 10
     ) -> list[dict[str, Any]]:
         """Get news, optionally filtered by symbol. Falls back MarketAux → Finnhub."""
-        key = f"news:{symbol or 'general'}:{limit}"
-        cached = self.cache.get(key)
-        if cached:
-            return cached
+        key = ("news", symbol, limit)
 
-        data: list[dict[str, Any]] = []
-        # Try MarketAux first (richer sentiment data)
-        try:
-            if symbol:
-                data = await self.marketaux.get_news_for_symbol(symbol, limit=limit)
-            else:
-                data = await self.marketaux.get_news(limit=limit)
-        except Exception:
-            pass
-
-        # Fallback to Finnhub company news if MarketAux failed
-        if not data and symbol:
+        async def load() -> list[dict[str, Any]]:
+            data: list[dict[str, Any]] = []
+            # Try MarketAux first (richer sentiment data)
             try:
-                from datetime import UTC, datetime, timedelta
-                to_date = datetime.now(UTC).strftime("%Y-%m-%d")
-                from_date = (datetime.now(UTC) - timedelta(days=2)).strftime("%Y-%m-%d")
-                finnhub_articles = await self.finnhub.get_company_news(symbol, from_date, to_date)
-                log.info("finnhub_news_fallback", symbol=symbol, articles=len(finnhub_articles))
-                data = [
-                    {
-                        "title": a.get("headline", ""),
-                        "description": a.get("summary", ""),
-                        "snippet": a.get("summary", "")[:200],
-                        "url": a.get("url", ""),
-                        "source": a.get("source", ""),
-                        "published_at": a.get("datetime", ""),
-                        "symbols": [symbol],
-                        "sentiment": None,
-                        "relevance": None,
-                    }
-                    for a in finnhub_articles[:limit]
-                ]
+                if symbol:
+                    data = await self.marketaux.get_news_for_symbol(symbol, limit=limit)
+                else:
+                    data = await self.marketaux.get_news(limit=limit)
             except Exception:
                 pass
 
-        # Fallback to Finnhub general news if no symbol
-        if not data and not symbol:
-            try:
-                finnhub_articles = await self.finnhub.get_general_news()
-                log.info("finnhub_general_news_fallback", articles=len(finnhub_articles))
-                data = [
-                    {
-                        "title": a.get("headline", ""),
-                        "description": a.get("summary", ""),
-                        "snippet": a.get("summary", "")[:200],
-                        "url": a.get("url", ""),
-                        "source": a.get("source", ""),
-                        "published_at": a.get("datetime", ""),
-                        "symbols": [],
-                        "sentiment": None,
-                        "relevance": None,
-                    }
-                    for a in finnhub_articles[:limit]
-                ]
-            except Exception:
-                pass
+            # Fallback to Finnhub company news if MarketAux failed
+            if not data and symbol:
+                try:
+                    from_date, to_date = _news_window()
+                    finnhub_articles = await self.finnhub.get_company_news(symbol, from_date, to_date)
+                    log.info("finnhub_news_fallback", symbol=symbol, articles=len(finnhub_articles))
+                    data = [_finnhub_article(a, [symbol]) for a in finnhub_articles[:limit]]
+                except Exception:
+                    pass
+
+            # Fallback to Finnhub general news if no symbol
+            if not data and not symbol:
+                try:
+                    finnhub_articles = await self.finnhub.get_general_news()
+                    log.info("finnhub_general_news_fallback", articles=len(finnhub_articles))
+                    data = [_finnhub_article(a, []) for a in finnhub_articles[:limit]]
+                except Exception:
+                    pass
+            return data
 
-        if data:
-            self.cache.set(key, data, CACHE_TTL["news"])
-        return data
+        # The general feed tolerates a few minutes of staleness; per-symbol news doesn't
+        stale = 0 if symbol else CACHE_STALE_TTL["news"]
+        return await self._cached(key, CACHE_TTL["news"], load, stale)
 
     async def get_macro_data(self, series_id: str | None = None) -> Any:
         """Get macro economic data."""
         if series_id:
-            key = f"macro:{series_id}"
-            cached = self.cache.get(key)
-            if cached:
-                return cached
-            data = await self.fred.get_series(series_id)
-            self.cache.set(key, data, CACHE_TTL["macro"])
-            return data
-        else:
-            key = "macro:snapshot"
-            cached = self.cache.get(key)
-            if cached:
-                return cached
-            data = await self.fred.get_macro_snapshot()
-            self.cache.set(key, data, CACHE_TTL["macro"])
-            return data
+            return await self._cached(
+                ("macro", series_id), CACHE_TTL["macro"], lambda: self.fred.get_series(series_id),
+            )
+        # No stale serving: the hourly poller diffs this snapshot for release alerts
+        return await self._cached(("macro", None), CACHE_TTL["macro"], self.fred.get_macro_snapshot)
 
     async def get_earnings_transcript(
         self, symbol: str, year: int, quarter: int
     ) -> dict[str, Any]:
         """Get earnings call transcript."""
-        key = f"transcript:{symbol}:{year}:{quarter}"
-        cached = self.cache.get(key)
-        if cached:
-            return cached
-        data = await self.fmp.get_earnings_transcript(symbol, year, quarter)
-        self.cache.set(key, data, CACHE_TTL["transcript"])
-        return data
+        key = ("transcript", symbol, year, quarter)
+        return await self._cached(
+            key,
+            CACHE_TTL["transcript"],
+            lambda: self.fmp.get_earnings_transcript(symbol, year, quarter),
+            persist=True,
+        )
 
     async def get_sec_filings(
         self, symbol: str, form_types: list[str] | None = None
     ) -> list[dict[str, Any]]:
         """Get SEC filings for a company."""
-        key = f"filings:{symbol}:{form_types}"
-        cached = self.cache.get(key)
-        if cached:
-            return cached
-        data = await self.sec_edgar.get_company_filings(symbol, form_types=form_types)
-        self.cache.set(key, data, CACHE_TTL["filing"])
-        return data
+        # Sorted so ["10-Q", "10-K"] and ["10-K", "10-Q"] share one entry; [] and None both mean all
+        key = ("filings", symbol, tuple(sorted(form_types)) if form_types else None)
+        return await self._cached(
+            key,
+            CACHE_TTL["filing"],
+            lambda: self.sec_edgar.get_company_filings(symbol, form_types=form_types),
+            persist=True,
+        )
 
     async def get_sector_performance(self) -> list[dict[str, Any]]:
         """Get sector performance data."""
-        key = "sector_perf"
-        cached = self.cache.get(key)
-        if cached:
-            return cached
-        data = await self.fmp.get_sector_performance()
-        self.cache.set(key, data, CACHE_TTL["fundamentals"])
-        return data
+        key = ("sector_perf",)
+        return await self._cached(
+            key, CACHE_TTL["sector_perf"], self.fmp.get_sector_performance, CACHE_STALE_TTL["sector_perf"],
+        )
 
     async def get_research_papers(
         self, query: str | None = None, max_results: int = 10
@@ -286,199 +390,160 @@ class DataManager:
 
         Falls back to per-symbol Finnhub if MarketAux fails.
         """
-        key = f"news:batch:{','.join(sorted(symbols))}:{limit}"
-        cached = self.cache.get(key)
-        if cached:
-            return cached
+        key = ("news_batch", frozenset(symbols), limit)  # order-insensitive without a sort
 
-        data: list[dict[str, Any]] = []
-        # MarketAux supports comma-separated symbols in one call
-        try:
-            joined = ",".join(symbols)
-            data = await self.marketaux.get_news(symbols=joined, limit=limit)
-            log.info("marketaux_batch_news", symbols=len(symbols), articles=len(data))
-        except Exception:
-            pass
-
-        # Fallback: per-symbol Finnhub (more expensive but always works)
-        if not data:
-            from datetime import UTC, datetime, timedelta
-            to_date = datetime.now(UTC).strftime("%Y-%m-%d")
-            from_date = (datetime.now(UTC) - timedelta(days=2)).strftime("%Y-%m-%d")
-            for symbol in symbols:
-                try:
-                    finnhub_articles = await self.finnhub.get_company_news(symbol, from_date, to_date)
+        async def load() -> list[dict[str, Any]]:
+            data: list[dict[str, Any]] = []
+            # MarketAux supports comma-separated symbols in one call
+            try:
+                joined = ",".join(symbols)
+                data = await self.marketaux.get_news(symbols=joined, limit=limit)
+                log.info("marketaux_batch_news", symbols=len(symbols), articles=len(data))
+            except Exception:
+                pass
+
+            # Fallback: per-symbol Finnhub (more expensive but always works)
+            if not data:
+                from_date, to_date = _news_window()
+                sem = asyncio.Semaphore(_FALLBACK_CONCURRENCY)
+
+                async def fetch(symbol: str) -> list[dict[str, Any]]:
+                    async with sem:
+                        return await self.finnhub.get_company_news(symbol, from_date, to_date)
+
+                responses = await asyncio.gather(*(fetch(s) for s in symbols), return_exceptions=True)
+                for symbol, finnhub_articles in zip(symbols, responses):
+                    if isinstance(finnhub_articles, BaseException):
+                        continue
                     log.info("finnhub_news_fallback", symbol=symbol, articles=len(finnhub_articles))
-                    data.extend(
-                        {
-                            "title": a.get("headline", ""),
-                            "description": a.get("summary", ""),
-                            "snippet": a.get("summary", "")[:200],
-                            "url": a.get("url", ""),
-                            "source": a.get("source", ""),
-                            "published_at": a.get("datetime", ""),
-                            "symbols": [symbol],
-                            "sentiment": None,
-                            "relevance": None,
-                        }
-                        for a in finnhub_articles[:5]
-                    )
-                except Exception:
-                    pass
+                    data.extend(_finnhub_article(a, [symbol]) for a in finnhub_articles[:5])
+            return data
 
-        if data:
-            self.cache.set(key, data, CACHE_TTL["news"])
-        return data
+        return await self._cached(key, CACHE_TTL["news"], load)
 
     async def get_news_for_sectors(
         self, sectors: str, limit: int = 10
     ) -> list[dict[str, Any]]:
         """Get news filtered by MarketAux industry sectors."""
-        key = f"news:sectors:{sectors}:{limit}"
-        cached = self.cache.get(key)
-        if cached:
-            return cached
-        data = await self.marketaux.get_news(sectors=sectors, limit=limit)
-        self.cache.set(key, data, CACHE_TTL["news"])
-        return data
+        key = ("news_sectors", sectors, limit)
+        return await self._cached(
+            key, CACHE_TTL["news"], lambda: self.marketaux.get_news(sectors=sectors, limit=limit),
+        )
 
     async def get_technical_indicators(self, symbol: str) -> dict[str, Any]:
         """Get technical analysis indicators: SMA, RSI, EMA, MACD."""
-        key = f"technicals:{symbol}"
-        cached = self.cache.get(key)
-        if cached:
-            return cached
-
-        # Fetch all indicators in parallel (return_exceptions so partial results work)
-        sma_20, sma_50, sma_200, rsi_14, ema_12, ema_26 = await asyncio.gather(
-            self.fmp.get_technical_indicator(symbol, "sma", period=20),
-            self.fmp.get_technical_indicator(symbol, "sma", period=50),
-            self.fmp.get_technical_indicator(symbol, "sma", period=200),
-            self.fmp.get_technical_indicator(symbol, "rsi", period=14),
-            self.fmp.get_technical_indicator(symbol, "ema", period=12),
-            self.fmp.get_technical_indicator(symbol, "ema", period=26),
-            return_exceptions=True,
-        )
+        key = ("technicals", symbol)
+
+        async def load() -> dict[str, Any]:
+            # Fetch all indicators in parallel (return_exceptions so partial results work)
+            sma_20, sma_50, sma_200, rsi_14, ema_12, ema_26 = await asyncio.gather(
+                self.fmp.get_technical_indicator(symbol, "sma", period=20),
+                self.fmp.get_technical_indicator(symbol, "sma", period=50),
+                self.fmp.get_technical_indicator(symbol, "sma", period=200),
+                self.fmp.get_technical_indicator(symbol, "rsi", period=14),
+                self.fmp.get_technical_indicator(symbol, "ema", period=12),
+                self.fmp.get_technical_indicator(symbol, "ema", period=26),
+                return_exceptions=True,
+            )
+
+            # Treat exceptions as empty results
+            if isinstance(sma_20, Exception): sma_20 = []
+            if isinstance(sma_50, Exception): sma_50 = []
+            if isinstance(sma_200, Exception): sma_200 = []
+            if isinstance(rsi_14, Exception): rsi_14 = []
+            if isinstance(ema_12, Exception): ema_12 = []
+            if isinstance(ema_26, Exception): ema_26 = []
+
+            # Compute MACD from EMA-12 and EMA-26
+            ema12_val = ema_12[0].get("ema") if ema_12 else None
+            ema26_val = ema_26[0].get("ema") if ema_26 else None
+            macd = (ema12_val - ema26_val) if ema12_val is not None and ema26_val is not None else None
+
+            data = {
+                "symbol": symbol,
+                "sma_20": sma_20[0].get("sma") if sma_20 else None,
+                "sma_50": sma_50[0].get("sma") if sma_50 else None,
+                "sma_200": sma_200[0].get("sma") if sma_200 else None,
+                "rsi_14": rsi_14[0].get("rsi") if rsi_14 else None,
+                "ema_12": ema12_val,
+                "ema_26": ema26_val,
+                "macd": macd,
+            }
+            return data
 
-        # Treat exceptions as empty results
-        if isinstance(sma_20, Exception): sma_20 = []
-        if isinstance(sma_50, Exception): sma_50 = []
-        if isinstance(sma_200, Exception): sma_200 = []
-        if isinstance(rsi_14, Exception): rsi_14 = []
-        if isinstance(ema_12, Exception): ema_12 = []
-        if isinstance(ema_26, Exception): ema_26 = []
-
-        # Compute MACD from EMA-12 and EMA-26
-        ema12_val = ema_12[0].get("ema") if ema_12 else None
-        ema26_val = ema_26[0].get("ema") if ema_26 else None
-        macd = (ema12_val - ema26_val) if ema12_val is not None and ema26_val is not None else None
-
-        data = {
-            "symbol": symbol,
-            "sma_20": sma_20[0].get("sma") if sma_20 else None,
-            "sma_50": sma_50[0].get("sma") if sma_50 else None,
-            "sma_200": sma_200[0].get("sma") if sma_200 else None,
-            "rsi_14": rsi_14[0].get("rsi") if rsi_14 else None,
-            "ema_12": ema12_val,
-            "ema_26": ema26_val,
-            "macd": macd,
-        }
-        self.cache.set(key, data, CACHE_TTL["macro"])  # 30 min TTL
-        return data
+        return await self._cached(key, CACHE_TTL["technicals"], load, CACHE_STALE_TTL["technicals"])
 
     async def get_historical_prices(self, symbol: str, limit: int = 90) -> list[dict[str, Any]]:
         """Get historical daily OHLCV data."""
-        key = f"hist_prices:{symbol}:{limit}"
-        cached = self.cache.get(key)
-        if cached:
-            return cached
-        data = await self.fmp.get_historical_price(symbol, limit=limit)
-        self.cache.set(key, data, CACHE_TTL["quote"])
-        return data
+        key = ("hist_prices", symbol, limit)
+        return await self._cached(
+            key, CACHE_TTL["hist_prices"], lambda: self.fmp.get_historical_price(symbol, limit=limit),
+        )
 
     async def get_trending_stocks(self, limit: int = 10) -> list[dict[str, Any]]:
         """Get stocks trending in financial news right now."""
-        key = f"trending:{limit}"
-        cached = self.cache.get(key)
-        if cached:
-            return cached
-        data = await self.marketaux.get_trending_entities(limit=limit)
-        self.cache.set(key, data, CACHE_TTL["news"])
-        return data
+        key = ("trending", limit)
+        return await self._cached(
+            key, CACHE_TTL["news"], lambda: self.marketaux.get_trending_entities(limit=limit),
+        )
 
     async def get_sentiment(self, symbols: list[str], interval: str = "day", days: int = 7) -> dict[str, Any]:
         """Get news sentiment time series for symbols."""
         joined = ",".join(symbols)
-        key = f"sentiment:{joined}:{interval}:{days}"
-        cached = self.cache.get(key)
-        if cached:
-            return cached
-        data = await self.marketaux.get_sentiment_stats(
-            symbols=joined, interval=interval, limit=days,
+        key = ("sentiment", joined, interval, days)
+        return await self._cached(
+            key,
+            CACHE_TTL["news"],
+            lambda: self.marketaux.get_sentiment_stats(symbols=joined, interval=interval, limit=days),
         )
-        self.cache.set(key, data, CACHE_TTL["news"])
-        return data
 
     async def get_insider_transactions(self, symbol: str) -> dict[str, Any]:
         """Get insider transactions from Finnhub."""
-        key = f"insider:{symbol}"
-        cached = self.cache.get(key)
-        if cached:
-            return cached
-        data = await self.finnhub.get_insider_transactions(symbol)
-        self.cache.set(key, data, CACHE_TTL["analyst"])  # 6 hour TTL
-        return data
+        key = ("insider", symbol)
+        return await self._cached(
+            key, CACHE_TTL["insider"], lambda: self.finnhub.get_insider_transactions(symbol),
+        )
 
     async def get_ai_news(self) -> dict[str, Any]:
         """Get AI/tech news from multiple sources with filtering and dedup."""
-        key = "ai_news:latest"
-        cached = self.cache.get(key)
-        if cached:
-            return cached
-
-        # Parallel fetch from 3 sources
-        marketaux_result, finnhub_result, arxiv_result = await asyncio.gather(
-            self.marketaux.get_news(sectors="Technology", limit=10),
-            self.finnhub.get_general_news(),
-            self.arxiv.search_ai_research(max_results=10),
-            return_exceptions=True,
-        )
+        key = ("ai_news",)
+
+        async def load() -> dict[str, Any]:
+            # Parallel fetch from 3 sources
+            marketaux_result, finnhub_result, arxiv_result = await asyncio.gather(
+                self.marketaux.get_news(sectors="Technology", limit=10),
+                self.finnhub.get_general_news(),
+                self.arxiv.search_ai_research(max_results=10),
+                return_exceptions=True,
+            )
+
+            articles: list[dict[str, Any]] = []
+            seen_urls: set[str] = set()
+
+            # Filter MarketAux results for AI relevance
+            if not isinstance(marketaux_result, Exception):
+                for article in marketaux_result:
+                    text = f"{article.get('title', '')} {article.get('description', '')}"
+                    url = article.get("url", "")
+                    if is_ai_related(text) and url and url not in seen_urls:
+                        seen_urls.add(url)
+                        articles.append(article)
+
+            # Filter Finnhub results for AI relevance
+            if not isinstance(finnhub_result, Exception):
+                for a in finnhub_result:
+                    text = f"{a.get('headline', '')} {a.get('summary', '')}"
+                    url = a.get("url", "")
+                    if is_ai_related(text) and url and url not in seen_urls:
+                        seen_urls.add(url)
+                        articles.append(_finnhub_article(a, []))
+
+            # arXiv papers (already AI-focused by category)
+            papers: list[dict[str, Any]] = []
+            if not isinstance(arxiv_result, Exception):
+                papers = arxiv_result[:5]
+
+            data = {"articles": articles[:20], "papers": papers}
+            return data
 
-        articles: list[dict[str, Any]] = []
-        seen_urls: set[str] = set()
-
-        # Filter MarketAux results for AI relevance
-        if not isinstance(marketaux_result, Exception):
-            for article in marketaux_result:
-                text = f"{article.get('title', '')} {article.get('description', '')}"
-                url = article.get("url", "")
-                if is_ai_related(text) and url and url not in seen_urls:
-                    seen_urls.add(url)
-                    articles.append(article)
-
-        # Filter Finnhub results for AI relevance
-        if not isinstance(finnhub_result, Exception):
-            for a in finnhub_result:
-                text = f"{a.get('headline', '')} {a.get('summary', '')}"
-                url = a.get("url", "")
-                if is_ai_related(text) and url and url not in seen_urls:
-                    seen_urls.add(url)
-                    articles.append({
-                        "title": a.get("headline", ""),
-                        "description": a.get("summary", ""),
-                        "snippet": a.get("summary", "")[:200],
-                        "url": url,
-                        "source": a.get("source", ""),
-                        "published_at": a.get("datetime", ""),
-                        "symbols": [],
-                        "sentiment": None,
-                    })
-
-        # arXiv papers (already AI-focused by category)
-        papers: list[dict[str, Any]] = []
-        if not isinstance(arxiv_result, Exception):
-            papers = arxiv_result[:5]
-
-        data = {"articles": articles[:20], "papers": papers}
-        self.cache.set(key, data, 120)  # 2 min TTL
-        return data
+        return await self._cached(key, 120, load)  # 2 min TTL
@@ -1,14 +1,27 @@
 """Analyst rating/target change detection."""
 
 import structlog
+from collections import OrderedDict
 from typing import Any
 from notifications.types import Notification
 from config.constants import NotificationType
 
 log = structlog.get_logger(__name__)
 
-# Cache of last-known analyst state per symbol
-_last_known: dict[str, dict[str, Any]] = {}
+# Cache of last-known analyst state per symbol, least recently updated evicted first
+_last_known: OrderedDict[str, dict[str, Any]] = OrderedDict()
+_LAST_KNOWN_MAX_SIZE = 10_000
+
+
+def _action_id(action: dict[str, Any]) -> tuple[str, str, str]:
+    return (action.get("company", ""), action.get("gradeDate", ""), action.get("toGrade", ""))
+
+
+def _remember(symbol: str, state: dict[str, Any]) -> None:
+    _last_known[symbol] = state
+    _last_known.move_to_end(symbol)
+    if len(_last_known) > _LAST_KNOWN_MAX_SIZE:
+        _last_known.popitem(last=False)
 
 
 def process_analyst_data(
@@ -25,9 +38,9 @@ def process_analyst_data(
     last = _last_known.get(symbol, {})
     last_ids = last.get("upgrade_ids", set())
 
-    for action in upgrades[:5]:
-        # Create a simple ID from the action data
-        action_id = f"{action.get('company', '')}:{action.get('gradeDate', '')}:{action.get('toGrade', '')}"
+    # IDs for the 10 most recent actions; the first 5 are also the ones we notify on
+    ids = [_action_id(a) for a in upgrades[:10]]
+    for action, action_id in zip(upgrades[:5], ids):
         if action_id in last_ids:
             continue
 
@@ -56,11 +69,7 @@ def process_analyst_data(
         notifications.append(notif)
 
     # Update cache
-    new_ids = {
-        f"{a.get('company', '')}:{a.get('gradeDate', '')}:{a.get('toGrade', '')}"
-        for a in upgrades[:10]
-    }
-    _last_known[symbol] = {"upgrade_ids": new_ids}
+    _remember(symbol, {"upgrade_ids": set(ids)})
 
     # Check estimate changes (from FMP analyst estimates)
     estimates = analyst_data.get("estimates", [])
@@ -87,6 +96,6 @@ def process_analyst_data(
                 notifications.append(notif)
 
         if current_target:
-            _last_known.setdefault(symbol, {})["est_eps_avg"] = current_target
+            _last_known[symbol]["est_eps_avg"] = current_target
 
     return notifications
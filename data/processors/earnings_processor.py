@@ -2,12 +2,17 @@
 
 import structlog
 from typing import Any
+from data.cache import TTLCache
 from notifications.types import Notification
 from config.constants import NotificationType
 
 log = structlog.get_logger(__name__)
 
-_seen_earnings: set[str] = set()
+# (symbol, period) pairs already processed. A period can sit in the "most
+# recent 2" window we check for well over two quarters (e.g. a late 10-K
+# delays the next report), so entries outlive any plausible stay there.
+_SEEN_EARNINGS_TTL = 400 * 86400
+_seen_earnings = TTLCache(max_size=10_000)
 
 
 def process_earnings(
@@ -16,11 +21,12 @@ def process_earnings(
 ) -> list[Notification]:
     """Detect earnings surprises."""
     notifications = []
+    _seen_earnings.cleanup()  # nothing else sweeps this cache; cheap when nothing has expired
 
     for earning in earnings[:2]:  # Check most recent 2 quarters
         period = earning.get("period", "")
-        key = f"{symbol}:{period}"
-        if key in _seen_earnings:
+        key = (symbol, period)
+        if _seen_earnings.get(key):
             continue
 
         actual = earning.get("actual")
@@ -29,7 +35,7 @@ def process_earnings(
         if actual is None or estimate is None:
             continue
 
-        _seen_earnings.add(key)
+        _seen_earnings.set(key, True, _SEEN_EARNINGS_TTL)
 
         if estimate != 0:
             surprise_pct = ((actual - estimate) / abs(estimate)) * 100
@@ -1,12 +1,17 @@
 """Factor grade processor — computes quantitative ratings relative to sector peers."""
 
 import asyncio
+import bisect
 import structlog
 from typing import Any
 from data.manager import DataManager
 
 log = structlog.get_logger(__name__)
 
+# Peers fetched at once (each is three lookups). Shared by every holding a
+# portfolio health check grades, so a large portfolio can't flood FMP.
+_PEER_CONCURRENCY = 8
+
 # Grade thresholds: percentile → letter grade
 GRADE_MAP = [
     (95, "A+"), (85, "A"), (75, "A-"),
@@ -37,32 +42,42 @@ SECTOR_PEERS: dict[str, list[str]] = {
 }
 
 
+# Letter grade → numeric score (1.0-5.0)
+GRADE_SCORES = {
+    "A+": 5.0, "A": 4.7, "A-": 4.3,
+    "B+": 4.0, "B": 3.7, "B-": 3.3,
+    "C+": 3.0, "C": 2.7, "C-": 2.3,
+    "D+": 2.0, "D": 1.7,
+    "F": 1.0,
+}
+
+# GRADE_MAP thresholds are whole numbers, so the grade for any percentile is
+# the grade of its floor — precompute all 101 of them once
+_GRADE_BY_PERCENTILE = [
+    next(grade for threshold, grade in GRADE_MAP if pct >= threshold) for pct in range(101)
+]
+
+
 def _percentile_to_grade(percentile: float) -> str:
     """Convert a percentile (0-100) to a letter grade."""
-    for threshold, grade in GRADE_MAP:
-        if percentile >= threshold:
-            return grade
-    return "F"
+    return _GRADE_BY_PERCENTILE[max(0, min(100, int(percentile)))]
 
 
 def _grade_to_score(grade: str) -> float:
     """Convert letter grade to numeric score (1.0-5.0)."""
-    grade_scores = {
-        "A+": 5.0, "A": 4.7, "A-": 4.3,
-        "B+": 4.0, "B": 3.7, "B-": 3.3,
-        "C+": 3.0, "C": 2.7, "C-": 2.3,
-        "D+": 2.0, "D": 1.7,
-        "F": 1.0,
-    }
-    return grade_scores.get(grade, 2.5)
+    return GRADE_SCORES.get(grade, 2.5)
 
 
 def _compute_percentile(value: float, peer_values: list[float], higher_is_better: bool = True) -> float:
-    """Compute where a value ranks among peers (0-100 percentile)."""
+    """Compute where a value ranks among peers (0-100 percentile).
+
+    peer_values must be sorted ascending (the _extract_peer_* helpers return
+    them that way) so the rank is two binary searches instead of two scans.
+    """
     if not peer_values:
         return 50.0
-    below = sum(1 for v in peer_values if v < value)
-    equal = sum(1 for v in peer_values if v == value)
+    below = bisect.bisect_left(peer_values, value)
+    equal = bisect.bisect_right(peer_values, value, lo=below) - below
     percentile = ((below + 0.5 * equal) / len(peer_values)) * 100
     if not higher_is_better:
         percentile = 100 - percentile
@@ -74,25 +89,22 @@ class FactorGradeProcessor:
 
     def __init__(self, data_manager: DataManager) -> None:
         self.dm = data_manager
+        self._peer_sem = asyncio.Semaphore(_PEER_CONCURRENCY)
 
     async def get_factor_grades(self, symbol: str) -> dict[str, Any]:
         """Compute factor grades and quant rating for a symbol."""
-        # Get company sector
-        profile = await self.dm.get_company_profile(symbol)
+        # Get company sector and target stock data — independent lookups, so
+        # issue them together rather than paying each round trip in turn
+        profile, fundamentals, quote, analyst, earnings, hist_prices = await asyncio.gather(
+            self.dm.get_company_profile(symbol),
+            self.dm.get_fundamentals(symbol),
+            self.dm.get_quote(symbol),
+            self.dm.get_analyst_data(symbol),
+            self.dm.get_earnings(symbol),
+            self._get_price_history(symbol),
+        )
         sector = profile.get("sector", "Technology")
 
-        # Get target stock data
-        fundamentals = await self.dm.get_fundamentals(symbol)
-        quote = await self.dm.get_quote(symbol)
-        analyst = await self.dm.get_analyst_data(symbol)
-        earnings = await self.dm.get_earnings(symbol)
-
-        # Get historical prices for momentum
-        try:
-            hist_prices = await self.dm.get_historical_prices(symbol, limit=260)
-        except Exception:
-            hist_prices = []
-
         # Get peer data
         peer_symbols = await self._get_peers(symbol, sector)
         peer_data = await self._fetch_peer_data(peer_symbols)
@@ -180,17 +192,14 @@ class FactorGradeProcessor:
 
         # Compute weighted quality score
         if total_value > 0:
-            weighted_score = sum(
-                h["quant_rating"] * h["position_value"] / total_value
-                for h in holding_grades
-            )
+            weighted_score = sum(h["quant_rating"] * h["position_value"] for h in holding_grades) / total_value
         else:
             weighted_score = sum(h["quant_rating"] for h in holding_grades) / len(holding_grades)
 
         # Sector concentration (Herfindahl index)
         if total_value > 0:
             sector_pcts = {s: (v / total_value) * 100 for s, v in sector_weights.items()}
-            herfindahl = sum((pct / 100) ** 2 for pct in sector_pcts.values())
+            herfindahl = sum(v * v for v in sector_weights.values()) / (total_value * total_value)
         else:
             sector_pcts = {}
             herfindahl = 1.0
@@ -242,13 +251,20 @@ class FactorGradeProcessor:
             ],
         }
 
-    # ── Peer data fetching ──
+    # ── Data fetching ──
+
+    async def _get_price_history(self, symbol: str) -> list[dict[str, Any]]:
+        """Get ~1 year of daily prices for momentum (empty on failure)."""
+        try:
+            return await self.dm.get_historical_prices(symbol, limit=260)
+        except Exception:
+            return []
 
     async def _get_peers(self, symbol: str, sector: str) -> list[str]:
         """Get peer symbols for comparison."""
         # Try FMP peer list first
         try:
-            fmp_peers = await self.dm.fmp.get_stock_peers(symbol)
+            fmp_peers = await self.dm.get_stock_peers(symbol)
             if fmp_peers and len(fmp_peers) >= 5:
                 return [p for p in fmp_peers[:15] if p != symbol]
         except Exception:
@@ -262,9 +278,13 @@ class FactorGradeProcessor:
         """Fetch fundamentals for peer symbols (best effort, parallel)."""
         async def _safe_fetch(symbol: str) -> dict[str, Any] | None:
             try:
-                fundamentals = await self.dm.get_fundamentals(symbol)
-                quote = await self.dm.get_quote(symbol)
-                analyst = await self.dm.get_analyst_data(symbol)
+                # The three lookups hit different endpoints; issue them together
+                async with self._peer_sem:
+                    fundamentals, quote, analyst = await asyncio.gather(
+                        self.dm.get_fundamentals(symbol),
+                        self.dm.get_quote(symbol),
+                        self.dm.get_analyst_data(symbol),
+                    )
                 return {"symbol": symbol, "fundamentals": fundamentals, "quote": quote, "analyst": analyst}
             except Exception:
                 return None
@@ -527,7 +547,7 @@ class FactorGradeProcessor:
     def _extract_peer_metric(
         peer_data: list[dict[str, Any]], metrics_key: str, ratios_key: str
     ) -> list[float]:
-        """Extract a metric from peer fundamentals data."""
+        """Extract a metric from peer fundamentals data (sorted ascending)."""
         values = []
         for p in peer_data:
             fund = p.get("fundamentals", {})
@@ -537,17 +557,19 @@ class FactorGradeProcessor:
             )
             if val is not None and isinstance(val, (int, float)) and val != 0:
                 values.append(float(val))
+        values.sort()
         return values
 
     @staticmethod
     def _extract_peer_ratio(peer_data: list[dict[str, Any]], ratio_key: str) -> list[float]:
-        """Extract a ratio from peer fundamentals data."""
+        """Extract a ratio from peer fundamentals data (sorted ascending)."""
         values = []
         for p in peer_data:
             fund = p.get("fundamentals", {})
             val = fund.get("ratios", {}).get(ratio_key)
             if val is not None and isinstance(val, (int, float)):
                 values.append(float(val))
+        values.sort()
         return values
 
     @staticmethod
@@ -3,28 +3,23 @@
 import time
 import structlog
 from typing import Any
+from data.cache import TTLCache
 from notifications.types import Notification
 from config.constants import NotificationType
 
 log = structlog.get_logger(__name__)
 
-# URL dedup with expiry — entries auto-expire so new articles aren't blocked forever
-_seen_urls: dict[str, float] = {}  # url -> monotonic timestamp when first seen
+# URL dedup with expiry — entries auto-expire so new articles aren't blocked forever.
+# The size cap evicts least-recently-seen URLs, never the whole set at once.
 _SEEN_TTL = 4 * 3600  # 4 hours (DB dedup covers 6 hours as a second layer)
+_SEEN_MAX_SIZE = 10_000
+_seen_urls = TTLCache(max_size=_SEEN_MAX_SIZE)
 
 # Throttle first-boot flood: only send articles from the last 2 hours on startup
 _initialized = False
 _BOOT_WINDOW = 2 * 3600  # seconds
 
 
-def _prune_seen() -> None:
-    """Remove expired URL entries to allow re-notification of updated stories."""
-    now = time.monotonic()
-    expired = [url for url, ts in _seen_urls.items() if now - ts > _SEEN_TTL]
-    for url in expired:
-        del _seen_urls[url]
-
-
 def _parse_publish_time(article: dict[str, Any]) -> float | None:
     """Parse article publish time to a Unix timestamp."""
     published = article.get("published_at")
@@ -54,9 +49,8 @@ def process_news_articles(
     """
     global _initialized
 
-    _prune_seen()
+    _seen_urls.cleanup()  # heap-ordered, so only touches expired URLs
     now_wall = time.time()
-    now_mono = time.monotonic()
     notifications = []
 
     for article in articles:
@@ -65,9 +59,9 @@ def process_news_articles(
             continue
 
         # URL dedup (expires after 4 hours so genuinely new articles get through)
-        if url in _seen_urls:
+        if _seen_urls.get(url):
             continue
-        _seen_urls[url] = now_mono
+        _seen_urls.set(url, True, _SEEN_TTL)
 
         # On first boot, skip old articles to avoid flooding
         if not _initialized:
@@ -1,52 +1,110 @@
-"""Per-API sliding window rate limiter with limit notifications."""
+"""Per-API rate limiter (GCRA or sliding window) with limit notifications."""
 
-import asyncio
 import time
+import asyncio
 import structlog
-from collections import defaultdict
+from collections import deque
 from typing import Callable, Awaitable
 
 log = structlog.get_logger(__name__)
 
 
+class GCRALimiter:
+    """Generic Cell Rate Algorithm — token-bucket semantics in a single float.
+
+    State is the theoretical arrival time (TAT) of the next request. A request
+    may proceed once ``now >= tat - tau``; admitting it advances TAT by one
+    emission interval. ``burst`` requests can go back-to-back, after which
+    calls are spaced evenly.
+
+    A full burst plus a minute of refill must still fit the quota, so the
+    emission interval is stretched to ``60 / (requests_per_minute - burst + 1)``:
+    no 60s window ever sees more than ``requests_per_minute`` calls.
+    """
+
+    def __init__(self, requests_per_minute: int, burst: int | None = None) -> None:
+        self.limit = requests_per_minute
+        if burst is None:
+            burst = max(1, requests_per_minute // 10)
+        burst = min(max(1, burst), requests_per_minute)
+        self.interval = 60.0 / (requests_per_minute - burst + 1)
+        self.tau = burst * self.interval
+        self.tat = 0.0
+
+    def reserve(self, now: float) -> float:
+        """Claim the next slot and return how long to wait before using it."""
+        new_tat = max(self.tat, now) + self.interval
+        self.tat = new_tat
+        return new_tat - now - self.tau
+
+    def used(self, now: float) -> int:
+        """Approximate number of slots consumed in the current burst window."""
+        backlog = max(0.0, self.tat - now)
+        return min(self.limit, int(-(-backlog // self.interval)))
+
+
+class SlidingWindowLimiter:
+    """Strict sliding-window log: never more than ``limit`` calls in any 60s span.
+
+    Used for every provider with a tight quota or fanned-out callers (see
+    RATE_LIMIT_ALGORITHMS), where GCRA's small burst would space calls seconds
+    apart; the window lets a whole minute's quota go at once.
+    """
+
+    def __init__(self, requests_per_minute: int) -> None:
+        self.limit = requests_per_minute
+        self._log: deque[float] = deque()
+
+    def reserve(self, now: float) -> float:
+        """Claim the next slot and return how long to wait before using it."""
+        log_ = self._log
+        while log_ and now - log_[0] >= 60.0:
+            log_.popleft()
+        # Slots are appended in order, so the entry `limit` back must age out first
+        slot = now if len(log_) < self.limit else max(now, log_[-self.limit] + 60.0)
+        log_.append(slot)
+        return slot - now
+
+    def used(self, now: float) -> int:
+        """Number of calls made in the last 60 seconds."""
+        return min(self.limit, sum(1 for t in self._log if 0.0 <= now - t < 60.0))
+
+
+_ALGORITHMS: dict[str, type[GCRALimiter] | type[SlidingWindowLimiter]] = {
+    "gcra": GCRALimiter,
+    "sliding": SlidingWindowLimiter,
+}
+
+
 class RateLimiter:
-    """Sliding window rate limiter for API calls."""
+    """Rate limiter for API calls, one bucket per API."""
 
     def __init__(self) -> None:
-        self._windows: dict[str, list[float]] = defaultdict(list)
-        self._locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._buckets: dict[str, GCRALimiter | SlidingWindowLimiter] = {}
         self._limits: dict[str, int] = {}
         # Track when we last notified about a throttle per API (avoid spam)
         self._last_throttle_notify: dict[str, float] = {}
         # Callback for rate limit events: async fn(api_name, wait_seconds)
         self.on_rate_limit: Callable[[str, float], Awaitable[None]] | None = None
 
-    def configure(self, api_name: str, requests_per_minute: int) -> None:
-        """Set rate limit for an API."""
+    def configure(self, api_name: str, requests_per_minute: int, algorithm: str = "gcra") -> None:
+        """Set rate limit for an API ('gcra' or 'sliding')."""
         self._limits[api_name] = requests_per_minute
+        self._buckets[api_name] = _ALGORITHMS[algorithm](requests_per_minute)
 
     async def acquire(self, api_name: str) -> None:
         """Wait until a request slot is available."""
-        limit = self._limits.get(api_name, 60)
-        async with self._locks[api_name]:
-            now = time.monotonic()
-            window = self._windows[api_name]
-
-            # Remove entries older than 60 seconds
-            window[:] = [t for t in window if now - t < 60.0]
-
-            if len(window) >= limit:
-                # Wait until the oldest entry expires
-                wait_time = 60.0 - (now - window[0])
-                if wait_time > 0:
-                    log.warning("rate_limit_throttle", api=api_name, wait_seconds=round(wait_time, 1))
-                    await self._notify_rate_limit(api_name, wait_time)
-                    await asyncio.sleep(wait_time)
-                    # Clean up again after waiting
-                    now = time.monotonic()
-                    window[:] = [t for t in window if now - t < 60.0]
-
-            window.append(time.monotonic())
+        bucket = self._buckets.get(api_name)
+        if bucket is None:
+            bucket = self._buckets[api_name] = GCRALimiter(self._limits.get(api_name, 60))
+
+        # The slot is reserved before sleeping, so concurrent callers queue up
+        # behind each other without holding a lock.
+        wait_time = bucket.reserve(time.monotonic())
+        if wait_time > 0:
+            log.warning("rate_limit_throttle", api=api_name, wait_seconds=round(wait_time, 1))
+            await self._notify_rate_limit(api_name, wait_time)
+            await asyncio.sleep(wait_time)
 
     async def _notify_rate_limit(self, api_name: str, wait_seconds: float) -> None:
         """Fire the rate limit callback, but debounce to once per 5 minutes per API."""
@@ -67,7 +125,7 @@ class RateLimiter:
         now = time.monotonic()
         stats = {}
         for api_name, limit in self._limits.items():
-            window = self._windows.get(api_name, [])
-            active = sum(1 for t in window if now - t < 60.0)
+            bucket = self._buckets.get(api_name)
+            active = bucket.used(now) if bucket else 0
             stats[api_name] = {"used": active, "limit": limit}
         return stats
@@ -194,6 +194,13 @@ class Scheduler:
         cleaned = self.dm.cache.cleanup()
         if cleaned > 0:
             log.debug("cache_cleaned", entries=cleaned)
+        if self.dm.persistent is not None:
+            try:
+                removed = await self.dm.persistent.cleanup_expired()
+                if removed > 0:
+                    log.debug("persistent_cache_cleaned", entries=removed)
+            except Exception as e:
+                log.warning("persistent_cache_cleanup_error", error=str(e))
 
     # Ensure loops don't start until bot is ready.
     # Stagger startups to avoid all pollers hitting Finnhub at t=0.
@@ -156,6 +156,7 @@ def mock_data_manager():
     dm.cache.cleanup = MagicMock(return_value=0)
     dm.cache.get = MagicMock(return_value=None)
     dm.cache.set = MagicMock()
+    dm.persistent = None
     dm.start = AsyncMock()
     dm.close = AsyncMock()
     return dm
@@ -0,0 +1,71 @@
+"""Tests for data/cache.py — in-memory TTL cache."""
+
+from unittest.mock import patch
+
+from data.cache import TTLCache
+
+
+class TestTTLCache:
+    def test_set_and_get(self):
+        cache = TTLCache()
+        cache.set("quote:AAPL", {"price": 185.0}, ttl=60)
+        assert cache.get("quote:AAPL") == {"price": 185.0}
+
+    def test_missing_key(self):
+        assert TTLCache().get("nope") is None
+
+    def test_expired_key_returns_none(self):
+        cache = TTLCache()
+        with patch("data.cache.time.monotonic", return_value=1000.0):
+            cache.set("k", "v", ttl=10)
+        with patch("data.cache.time.monotonic", return_value=1011.0):
+            assert cache.get("k") is None
+
+    def test_cleanup_removes_only_expired(self):
+        cache = TTLCache()
+        with patch("data.cache.time.monotonic", return_value=1000.0):
+            cache.set("short", 1, ttl=5)
+            cache.set("long", 2, ttl=500)
+        with patch("data.cache.time.monotonic", return_value=1010.0):
+            assert cache.cleanup() == 1
+            assert cache.get("long") == 2
+            assert cache.get("short") is None
+
+    def test_cleanup_skips_stale_heap_entries_after_reset(self):
+        cache = TTLCache()
+        with patch("data.cache.time.monotonic", return_value=1000.0):
+            cache.set("k", "old", ttl=5)
+            cache.set("k", "new", ttl=500)
+        with patch("data.cache.time.monotonic", return_value=1010.0):
+            assert cache.cleanup() == 0
+            assert cache.get("k") == "new"
+
+    def test_max_size_evicts_least_recently_used(self):
+        cache = TTLCache(max_size=2)
+        cache.set("a", 1, ttl=60)
+        cache.set("b", 2, ttl=60)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3, ttl=60)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_stale_entry_only_visible_through_get_stale(self):
+        cache = TTLCache()
+        with patch("data.cache.time.monotonic", return_value=1000.0):
+            cache.set("k", "v", ttl=10, stale=20)
+        with patch("data.cache.time.monotonic", return_value=1015.0):
+            assert cache.get("k") is None
+            assert cache.get_stale("k") == "v"
+        with patch("data.cache.time.monotonic", return_value=1031.0):
+            assert cache.get_stale("k") is None
+            assert cache.cleanup() == 0  # already dropped on read
+
+    def test_tuple_keys_with_equal_expiry(self):
+        cache = TTLCache()
+        with patch("data.cache.time.monotonic", return_value=1000.0):
+            cache.set(("news", None, 10), "general", ttl=5)
+            cache.set(("news", "AAPL", 10), "aapl", ttl=5)
+        with patch("data.cache.time.monotonic", return_value=1010.0):
+            # Tied expiry must not fall back to comparing None with str
+            assert cache.cleanup() == 2
@@ -0,0 +1,386 @@
+"""Tests for data/collectors — parsing, shared session, resilience and request behavior."""
+
+import asyncio
+from datetime import date, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import orjson
+import pytest
+from data.collectors.arxiv_research import ArxivCollector
+from data.collectors.base import (
+    CircuitBreaker,
+    NonRetryableError,
+    as_list,
+    close_shared_session,
+    first_item,
+    get_shared_session,
+    prewarm_connections,
+)
+from data.collectors.finnhub import FinnhubCollector
+from data.collectors.fmp import FMPCollector
+from data.collectors.fred import MACRO_SERIES, FredCollector
+from data.collectors.marketaux import MarketAuxCollector
+from data.collectors.sec_edgar import SECEdgarCollector
+from data.rate_limiter import RateLimiter
+
+
+ATOM_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom">
+  <title>arXiv Query</title>
+  <entry>
+    <id>http://arxiv.org/abs/2401.00001v1</id>
+    <published>2024-01-01T00:00:00Z</published>
+    <title>Deep Hedging
+ Revisited</title>
+    <summary>  We revisit deep hedging.  </summary>
+    <author><name>Alice Smith</name></author>
+    <author><name>Bob Jones</name></author>
+    <link href="http://arxiv.org/abs/2401.00001v1" rel="alternate" type="text/html"/>
+    <link title="pdf" href="http://arxiv.org/pdf/2401.00001v1" rel="related" type="application/pdf"/>
+    <category term="q-fin.CP"/>
+    <category term="cs.LG"/>
+  </entry>
+  <entry>
+    <id>http://arxiv.org/abs/2401.00002v1</id>
+    <title>Second Paper</title>
+    <summary>Short.</summary>
+  </entry>
+</feed>
+"""
+
+
+class TestArxivParse:
+    def test_parses_entries(self):
+        papers = ArxivCollector(RateLimiter())._parse_atom_feed(ATOM_FEED)
+        assert len(papers) == 2
+        first = papers[0]
+        assert first["title"] == "Deep Hedging  Revisited"
+        assert first["summary"] == "We revisit deep hedging."
+        assert first["authors"] == ["Alice Smith", "Bob Jones"]
+        assert first["pdf_url"] == "http://arxiv.org/pdf/2401.00001v1"
+        assert first["categories"] == ["q-fin.CP", "cs.LG"]
+        assert first["arxiv_id"] == "http://arxiv.org/abs/2401.00001v1"
+
+    def test_missing_fields_default_empty(self):
+        papers = ArxivCollector(RateLimiter())._parse_atom_feed(ATOM_FEED)
+        assert papers[1]["authors"] == []
+        assert papers[1]["pdf_url"] == ""
+        assert papers[1]["published"] == ""
+
+    def test_malformed_feed_returns_empty(self):
+        assert ArxivCollector(RateLimiter())._parse_atom_feed(b"<feed><entry>") == []
+
+
+class TestSharedSession:
+    async def test_collectors_share_one_session(self):
+        limiter = RateLimiter()
+        arxiv, fred = ArxivCollector(limiter), FredCollector(limiter)
+        try:
+            assert await arxiv.get_session() is await fred.get_session()
+        finally:
+            await close_shared_session()
+
+    async def test_session_recreated_after_close(self):
+        first = await get_shared_session()
+        await close_shared_session()
+        assert first.closed
+        second = await get_shared_session()
+        try:
+            assert second is not first
+        finally:
+            await close_shared_session()
+
+
+class TestFredMacroSnapshot:
+    async def test_failed_series_are_skipped(self):
+        async def fake_series(series_id, limit=10, sort_order="desc"):
+            if series_id == "VIXCLS":
+                raise RuntimeError("boom")
+            return [{"value": "1.0", "date": "2024-01-01"}]
+
+        fred = FredCollector(RateLimiter())
+        fred.get_series = AsyncMock(side_effect=fake_series)
+        snapshot = await fred.get_macro_snapshot()
+        assert "VIX" not in snapshot
+        assert len(snapshot) == len(MACRO_SERIES) - 1
+        assert snapshot["CPI"] == {"value": "1.0", "date": "2024-01-01", "series_id": "CPIAUCSL"}
+
+    async def test_cancelled_series_are_skipped(self):
+        async def fake_series(series_id, limit=10, sort_order="desc"):
+            if series_id == "VIXCLS":
+                raise asyncio.CancelledError()
+            return [{"value": "1.0", "date": "2024-01-01"}]
+
+        fred = FredCollector(RateLimiter())
+        fred.get_series = AsyncMock(side_effect=fake_series)
+        snapshot = await fred.get_macro_snapshot()
+        assert "VIX" not in snapshot
+        assert len(snapshot) == len(MACRO_SERIES) - 1
+
+
+class TestCircuitBreaker:
+    KEY = ("fmp", "https://example.com/stable/profile")
+
+    def test_closed_by_default(self):
+        assert CircuitBreaker().allow(self.KEY) is False
+
+    def test_open_then_single_half_open_probe(self):
+        breaker = CircuitBreaker(ttl=10)
+        with patch("data.collectors.base.time.monotonic", return_value=100.0):
+            breaker.trip(self.KEY)
+            with pytest.raises(NonRetryableError):
+                breaker.allow(self.KEY)
+        with patch("data.collectors.base.time.monotonic", return_value=111.0):
+            assert breaker.allow(self.KEY) is True
+            # A second caller is rejected while the probe is in flight
+            with pytest.raises(NonRetryableError):
+                breaker.allow(self.KEY)
+            breaker.reset(self.KEY)
+            assert breaker.allow(self.KEY) is False
+
+    def test_evicts_oldest_beyond_max_size(self):
+        breaker = CircuitBreaker(ttl=10, max_size=2)
+        for path in ("a", "b", "c"):
+            breaker.trip(("fmp", path))
+        assert breaker.allow(("fmp", "a")) is False
+
+    async def test_404_probe_closes_circuit(self):
+        breaker = CircuitBreaker(ttl=10)
+        session = MagicMock()
+        session.get.side_effect = lambda *a, **k: _FakeResponse(404)
+        fmp = FMPCollector(RateLimiter())
+        fmp._api_key = "k"
+        fmp.get_session = AsyncMock(return_value=session)
+        with patch("data.collectors.base._CIRCUIT", breaker):
+            with patch("data.collectors.base.time.monotonic", return_value=100.0):
+                breaker.trip(self.KEY)
+            with patch("data.collectors.base.time.monotonic", return_value=111.0):
+                with pytest.raises(NonRetryableError) as exc:
+                    await fmp._request(self.KEY[1])
+                assert exc.value.status == 404
+                # The endpoint answered, so later callers go straight through
+                assert breaker.allow(self.KEY) is False
+
+
+class TestFinnhubWebsocket:
+    async def test_trades_dispatched_to_subscribed_symbols(self):
+        class FakeWS:
+            def __init__(self, frames):
+                self.frames = frames
+                self.send = AsyncMock()
+
+            def __aiter__(self):
+                return self._iter()
+
+            async def _iter(self):
+                for frame in self.frames:
+                    yield frame
+
+        frames = [
+            '{"type":"ping"}',
+            '{"type":"trade","data":[{"s":"AAPL","p":1.0},{"s":"TSLA","p":2.0},{"s":"AAPL","p":3.0}]}',
+        ]
+        ws = FakeWS(frames)
+        callback = AsyncMock()
+        finnhub = FinnhubCollector(RateLimiter())
+        finnhub._api_key = "k"
+        with patch("data.collectors.finnhub.websockets.connect", AsyncMock(return_value=ws)):
+            await finnhub.start_websocket(["AAPL"], callback)
+        assert [c.args[0]["p"] for c in callback.await_args_list] == [1.0, 3.0]
+        ws.send.assert_awaited_once_with('{"type":"subscribe","symbol":"AAPL"}')
+
+
+class _FakeResponse:
+    def __init__(self, status, body=None, headers=None):
+        self.status = status
+        self._body = body
+        self.headers = headers or {}
+        self.request_info = MagicMock()
+        self.history = ()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    async def read(self):
+        if isinstance(self._body, bytes):
+            return self._body
+        return orjson.dumps(self._body) if self._body is not None else b""
+
+
+class TestConditionalRequests:
+    async def test_304_returns_cached_body(self):
+        session = MagicMock()
+        session.get.side_effect = [
+            _FakeResponse(200, {"seriess": [{"id": "GDP"}]}, {"ETag": '"v1"'}),
+            _FakeResponse(304),
+        ]
+        fred = FredCollector(RateLimiter())
+        fred._api_key = "k"
+        fred.get_session = AsyncMock(return_value=session)
+
+        first = await fred.get_series_info("GDP")
+        second = await fred.get_series_info("GDP")
+        assert first == second == {"id": "GDP"}
+        assert "If-None-Match" not in (session.get.call_args_list[0].kwargs["headers"] or {})
+        assert session.get.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+
+
+class TestMarketAuxNews:
+    async def test_entity_fields_taken_from_first_entity(self):
+        marketaux = MarketAuxCollector(RateLimiter())
+        marketaux._request = AsyncMock(return_value={"data": [
+            {"title": "A", "entities": [
+                {"symbol": "AAPL", "sentiment_score": 0.5, "match_score": 9.0},
+                {"symbol": None},
+                {"symbol": "MSFT"},
+                {"symbol": "AAPL"},
+            ]},
+            {"title": "B", "entities": []},
+            {"title": "C"},
+        ]})
+        news = await marketaux.get_news()
+        assert news[0]["symbols"] == ["AAPL", "MSFT"]
+        assert (news[0]["sentiment"], news[0]["relevance"]) == (0.5, 9.0)
+        assert news[1]["symbols"] == [] and news[1]["sentiment"] is None
+        assert news[2]["relevance"] is None
+
+    async def test_sentiment_timeline_is_columnar(self):
+        marketaux = MarketAuxCollector(RateLimiter())
+        marketaux._request = AsyncMock(return_value={"data": [{
+            "key": "AAPL", "name": "Apple", "total_documents": 5, "sentiment_avg": 0.2,
+            "data": [
+                {"date": "2025-01-01", "total_documents": 2, "sentiment_avg": 0.1,
+                 "doc_count_sentiment_positive": 1},
+                {"date": "2025-01-02", "total_documents": 3, "sentiment_avg": 0.3},
+            ],
+        }]})
+        stats = await marketaux.get_sentiment_stats("AAPL")
+        timeline = stats["AAPL"]["timeline"]
+        assert timeline["date"] == ["2025-01-01", "2025-01-02"]
+        assert timeline["articles"] == [2, 3]
+        assert timeline["sentiment_avg"] == [0.1, 0.3]
+        assert timeline["positive"] == [1, 0]
+
+
+class TestSingleflight:
+    async def test_concurrent_identical_requests_share_one_fetch(self):
+        session = MagicMock()
+        session.get.side_effect = lambda *a, **k: _FakeResponse(200, [{"symbol": "AAPL"}])
+        fmp = FMPCollector(RateLimiter())
+        fmp._api_key = "k"
+        fmp.get_session = AsyncMock(return_value=session)
+
+        results = await asyncio.gather(fmp.get_quote("AAPL"), fmp.get_quote("AAPL"), fmp.get_quote("MSFT"))
+        assert results[0] == results[1] == {"symbol": "AAPL"}
+        assert session.get.call_count == 2
+
+        # Completed fetches are forgotten, so a later call hits the API again
+        await fmp.get_quote("AAPL")
+        assert session.get.call_count == 3
+
+
+class TestResponseDecoding:
+    def make_fmp(self, *responses):
+        session = MagicMock()
+        session.get.side_effect = list(responses)
+        fmp = FMPCollector(RateLimiter())
+        fmp._api_key = "k"
+        fmp.get_session = AsyncMock(return_value=session)
+        return fmp, session
+
+    async def test_non_json_body_retried(self):
+        fmp, session = self.make_fmp(
+            _FakeResponse(200, b"<html>maintenance</html>"),
+            _FakeResponse(200, [{"symbol": "AAPL"}]),
+        )
+        with patch("utils.retry.asyncio.sleep", new_callable=AsyncMock):
+            assert await fmp.get_quote("AAPL") == {"symbol": "AAPL"}
+        assert session.get.call_count == 2
+
+    async def test_blank_body_decodes_to_none(self):
+        fmp, _ = self.make_fmp(_FakeResponse(200, b" \n"))
+        assert await fmp._request("https://example.com/stable/blank") is None
+
+
+class TestMissingApiKey:
+    async def test_request_fails_before_rate_limiter(self):
+        limiter = RateLimiter()
+        limiter.acquire = AsyncMock()
+        fmp = FMPCollector(limiter)
+        fmp._api_key = ""
+        with pytest.raises(NonRetryableError) as exc:
+            await fmp.get_quote("AAPL")
+        assert exc.value.status == 401
+        limiter.acquire.assert_not_awaited()
+
+
+class TestResponseShapeHelpers:
+    def test_as_list(self):
+        assert as_list([1, 2]) == [1, 2]
+        assert as_list({"error": "x"}) == []
+        assert as_list(None) == []
+
+    def test_first_item(self):
+        assert first_item([{"a": 1}, {"a": 2}]) == {"a": 1}
+        assert first_item([]) == {}
+        assert first_item({"Error Message": "bad"}) == {}
+
+
+class TestPrewarm:
+    async def test_heads_each_origin_once_and_ignores_errors(self):
+        def fake_head(url, **kwargs):
+            if "finnhub" not in url:
+                raise OSError("dns failure")
+            return _FakeResponse(200)
+
+        session = MagicMock()
+        session.head.side_effect = fake_head
+        with patch("data.collectors.base.get_shared_session", AsyncMock(return_value=session)):
+            await prewarm_connections([
+                "https://finnhub.io/api/v1",
+                "https://finnhub.io/api/v2",
+                "https://api.stlouisfed.org/fred",
+            ])
+        heads = sorted(c.args[0] for c in session.head.call_args_list)
+        assert heads == ["https://api.stlouisfed.org", "https://finnhub.io"]
+
+
+class TestFMPHistoricalPrice:
+    async def test_requests_bounded_date_range(self):
+        fmp = FMPCollector(RateLimiter())
+        fmp._request = AsyncMock(return_value=[{"date": str(i)} for i in range(200)])
+        rows = await fmp.get_historical_price("AAPL", limit=90)
+        assert len(rows) == 90
+        since = date.fromisoformat(fmp._request.call_args.kwargs["params"]["from"])
+        # 90 trading days need ~130 calendar days; the window must cover that
+        assert timedelta(days=130) <= date.today() - since <= timedelta(days=160)
+
+
+class TestSECSearchFilings:
+    async def test_hits_projected(self):
+        sec = SECEdgarCollector(RateLimiter())
+        sec._request = AsyncMock(return_value={"hits": {"hits": [
+            {"_id": "0001:a.htm", "_source": {
+                "form_type": "10-K", "entity_name": "Apple", "file_date": "2024-11-01",
+                "entity_id": "320193", "display_names": ["Apple Inc. (AAPL)"],
+            }},
+            {"_id": "0002:b.htm"},
+        ]}})
+        filings = await sec.search_filings("AAPL")
+        assert filings[0]["form_type"] == "10-K"
+        assert filings[0]["file_url"] == "https://www.sec.gov/Archives/edgar/data/320193/0001:a.htm"
+        assert filings[0]["description"] == "Apple Inc. (AAPL)"
+        assert filings[1]["entity_name"] == "" and filings[1]["description"] == ""
+        assert sec._request.call_args.kwargs["revalidate"] is True
+
+    async def test_no_hits(self):
+        sec = SECEdgarCollector(RateLimiter())
+        sec._request = AsyncMock(return_value={})
+        assert await sec.search_filings("AAPL") == []
+
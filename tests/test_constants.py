@@ -12,6 +12,7 @@ from config.constants import (
     METRIC_OPTIONS,
     MAX_WATCHLIST_SIZE,
     MAX_ALERTS_PER_USER,
+    is_ai_related,
 )
 
 
@@ -91,3 +92,22 @@ class TestLimits:
 
     def test_alerts_limit(self):
         assert MAX_ALERTS_PER_USER >= 10
+
+
+class TestIsAIRelated:
+    def test_matches_keyword_case_insensitive(self):
+        assert is_ai_related("openai unveils new model") is True
+        assert is_ai_related("Nvidia beats on AI CHIP demand") is True
+
+    def test_matches_multiword_keyword(self):
+        assert is_ai_related("Startups pivot to Generative AI tooling") is True
+
+    def test_unrelated_text(self):
+        assert is_ai_related("Fed holds rates steady; oil slips") is False
+        assert is_ai_related("") is False
+
+    def test_regex_fallback_matches_case_insensitively(self, monkeypatch):
+        monkeypatch.setattr("config.constants._AI_AUTOMATON", None)
+        assert is_ai_related("Nvidia beats on AI CHIP demand") is True
+        assert is_ai_related("Fed holds rates steady; oil slips") is False
+        assert is_ai_related("AI") is False
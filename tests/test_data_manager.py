@@ -1,5 +1,7 @@
 """Tests for data/manager.py — DataManager orchestration."""
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from data.manager import DataManager
@@ -35,3 +37,168 @@ class TestDataManagerCollectors:
             src = inspect.getsource(dm.health_check)
             for api in ["finnhub", "fred", "marketaux", "fmp", "sec_edgar", "arxiv"]:
                 assert api in src
+
+
+class TestStockPeersCache:
+    async def test_peers_fetched_once_then_cached(self):
+        dm = DataManager()
+        dm.fmp = MagicMock()
+        dm.fmp.get_stock_peers = AsyncMock(return_value=["MSFT", "GOOGL"])
+        assert await dm.get_stock_peers("AAPL") == ["MSFT", "GOOGL"]
+        assert await dm.get_stock_peers("AAPL") == ["MSFT", "GOOGL"]
+        dm.fmp.get_stock_peers.assert_awaited_once_with("AAPL")
+
+
+class TestHealthCheck:
+    async def test_failures_reported_false(self):
+        dm = DataManager()
+        for name in ("finnhub", "fred", "marketaux", "fmp", "sec_edgar", "arxiv"):
+            setattr(dm, name, MagicMock(health_check=AsyncMock(return_value=True)))
+        dm.fred.health_check = AsyncMock(side_effect=RuntimeError("down"))
+        dm.arxiv.health_check = AsyncMock(return_value=False)
+        health = await dm.health_check()
+        assert health == {
+            "finnhub": True, "fred": False, "marketaux": True,
+            "fmp": True, "sec_edgar": True, "arxiv": False,
+        }
+
+    async def test_hung_check_reported_false(self):
+        dm = DataManager()
+        for name in ("finnhub", "fred", "marketaux", "fmp", "sec_edgar", "arxiv"):
+            setattr(dm, name, MagicMock(health_check=AsyncMock(return_value=True)))
+
+        async def hang():
+            await asyncio.sleep(3600)
+
+        dm.arxiv.health_check = hang
+        with patch("data.manager._HEALTH_CHECK_TIMEOUT", 0.01):
+            health = await dm.health_check()
+        assert health["arxiv"] is False
+        assert health["fmp"] is True
+
+
+class TestClose:
+    async def test_failing_collector_close_does_not_abort_shutdown(self):
+        dm = DataManager()
+        for name in ("finnhub", "fred", "marketaux", "fmp", "sec_edgar", "arxiv"):
+            setattr(dm, name, MagicMock(close=AsyncMock(), stop_websocket=AsyncMock()))
+        dm.fred.close = AsyncMock(side_effect=RuntimeError("boom"))
+        with patch("data.manager.close_shared_session", new_callable=AsyncMock) as close_session:
+            await dm.close()
+        dm.arxiv.close.assert_awaited_once()
+        dm.finnhub.stop_websocket.assert_awaited_once()
+        close_session.assert_awaited_once()
+
+
+class TestCachedCoalescing:
+    async def test_concurrent_misses_share_one_fetch(self):
+        dm = DataManager()
+        release = asyncio.Event()
+
+        async def slow_quote(symbol):
+            await release.wait()
+            return {"symbol": symbol, "price": 1.0}
+
+        dm.fmp = MagicMock()
+        dm.fmp.get_quote = AsyncMock(side_effect=slow_quote)
+        calls = [asyncio.create_task(dm.get_quote("AAPL")) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*calls)
+        assert all(r == {"symbol": "AAPL", "price": 1.0} for r in results)
+        dm.fmp.get_quote.assert_awaited_once_with("AAPL")
+        assert dm._inflight == {}
+
+    async def test_empty_result_not_cached(self):
+        dm = DataManager()
+        dm.marketaux = MagicMock()
+        dm.marketaux.get_trending_entities = AsyncMock(return_value=[])
+        await dm.get_trending_stocks()
+        await dm.get_trending_stocks()
+        assert dm.marketaux.get_trending_entities.await_count == 2
+
+    async def test_stale_value_served_while_refreshing(self):
+        dm = DataManager()
+        dm.fmp = MagicMock()
+        dm.fmp.get_sector_performance = AsyncMock(return_value=[{"sector": "Tech", "v": 2}])
+        with patch("data.cache.time.monotonic", return_value=1000.0):
+            dm.cache.set(("sector_perf",), [{"sector": "Tech", "v": 1}], ttl=10, stale=60)
+        with patch("data.cache.time.monotonic", return_value=1020.0):
+            assert await dm.get_sector_performance() == [{"sector": "Tech", "v": 1}]
+            await asyncio.sleep(0)
+            assert await dm.get_sector_performance() == [{"sector": "Tech", "v": 2}]
+        dm.fmp.get_sector_performance.assert_awaited_once()
+
+    async def test_macro_snapshot_never_served_stale(self):
+        from config.constants import CACHE_TTL
+        dm = DataManager()
+        dm.fred = MagicMock(get_macro_snapshot=AsyncMock(side_effect=[{"CPI": {"value": "1"}}, {"CPI": {"value": "2"}}]))
+        with patch("data.cache.time.monotonic", return_value=1000.0):
+            await dm.get_macro_data()
+        # The hourly poller must see the new release, not last poll's snapshot
+        with patch("data.cache.time.monotonic", return_value=1000.0 + CACHE_TTL["macro"] + 1):
+            assert await dm.get_macro_data() == {"CPI": {"value": "2"}}
+
+
+class TestNewsBatchFallback:
+    async def test_finnhub_fallback_fetches_each_symbol_and_skips_failures(self):
+        dm = DataManager()
+        dm.marketaux = MagicMock(get_news=AsyncMock(side_effect=RuntimeError("down")))
+
+        async def company_news(symbol, from_date, to_date):
+            if symbol == "MSFT":
+                raise RuntimeError("boom")
+            return [{"headline": f"{symbol} news", "url": f"https://x/{symbol}"}]
+
+        dm.finnhub = MagicMock(get_company_news=AsyncMock(side_effect=company_news))
+        data = await dm.get_news_batch(["AAPL", "MSFT", "NVDA"])
+        assert [a["symbols"] for a in data] == [["AAPL"], ["NVDA"]]
+        assert dm.finnhub.get_company_news.await_count == 3
+
+    async def test_finnhub_fallback_skips_cancelled_symbols(self):
+        dm = DataManager()
+        dm.marketaux = MagicMock(get_news=AsyncMock(return_value=[]))
+
+        async def company_news(symbol, from_date, to_date):
+            if symbol == "MSFT":
+                raise asyncio.CancelledError()
+            return [{"headline": f"{symbol} news", "url": f"https://x/{symbol}"}]
+
+        dm.finnhub = MagicMock(get_company_news=AsyncMock(side_effect=company_news))
+        data = await dm.get_news_batch(["AAPL", "MSFT"])
+        assert [a["symbols"] for a in data] == [["AAPL"]]
+
+
+class TestPersistentCache:
+    def make_dm(self, stored=None):
+        dm = DataManager(persistent=MagicMock(
+            get=AsyncMock(return_value=stored), set=AsyncMock(), cleanup_expired=AsyncMock(),
+        ))
+        dm.fmp = MagicMock(get_earnings_transcript=AsyncMock(return_value={"content": "fresh"}))
+        return dm
+
+    async def test_memory_miss_served_from_store(self):
+        dm = self.make_dm(stored={"content": "stored"})
+        assert await dm.get_earnings_transcript("AAPL", 2025, 1) == {"content": "stored"}
+        dm.persistent.get.assert_awaited_once_with("transcript:AAPL:2025:1")
+        dm.fmp.get_earnings_transcript.assert_not_awaited()
+        # Now warm in memory: no second store read
+        await dm.get_earnings_transcript("AAPL", 2025, 1)
+        dm.persistent.get.assert_awaited_once()
+
+    async def test_upstream_load_written_through(self):
+        dm = self.make_dm()
+        assert await dm.get_earnings_transcript("AAPL", 2025, 1) == {"content": "fresh"}
+        dm.persistent.set.assert_awaited_once_with("transcript:AAPL:2025:1", {"content": "fresh"}, 604800)
+
+    async def test_store_failure_falls_through_to_upstream(self):
+        dm = self.make_dm()
+        dm.persistent.get = AsyncMock(side_effect=RuntimeError("db down"))
+        dm.persistent.set = AsyncMock(side_effect=RuntimeError("db down"))
+        assert await dm.get_earnings_transcript("AAPL", 2025, 1) == {"content": "fresh"}
+
+    async def test_filings_key_flattened(self):
+        dm = self.make_dm()
+        dm.sec_edgar = MagicMock(get_company_filings=AsyncMock(return_value=[{"form_type": "10-K"}]))
+        await dm.get_sec_filings("AAPL", form_types=["10-K", "8-K"])
+        assert dm.persistent.set.await_args.args[0] == "filings:AAPL:10-K,8-K"
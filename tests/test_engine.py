@@ -23,6 +23,10 @@ class TestExecuteToolFinancial:
         mock_data_manager.get_quote.assert_awaited_once_with("AAPL")
         assert result["c"] == 185.50
 
+    async def test_symbol_upper_cased(self, engine, mock_data_manager):
+        await engine._execute_tool("get_quote", {"symbol": "aapl"})
+        mock_data_manager.get_quote.assert_awaited_once_with("AAPL")
+
     async def test_get_company_profile(self, engine, mock_data_manager):
         result = await engine._execute_tool("get_company_profile", {"symbol": "AAPL"})
         mock_data_manager.get_company_profile.assert_awaited_once_with("AAPL")
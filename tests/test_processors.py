@@ -0,0 +1,102 @@
+"""Tests for data/processors — change detection state and factor grading."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from data.cache import TTLCache
+from data.processors import analyst_processor, earnings_processor, factor_processor, news_processor
+from data.processors.factor_processor import FactorGradeProcessor, _compute_percentile
+
+
+class TestAnalystProcessor:
+    def test_repeat_actions_not_renotified(self):
+        data = {"upgrades_downgrades": [
+            {"company": "MS", "gradeDate": "2025-01-02", "toGrade": "Buy", "fromGrade": "Hold", "action": "upgrade"},
+        ]}
+        with patch.dict(analyst_processor._last_known, clear=True):
+            assert len(analyst_processor.process_analyst_data("AAPL", data)) == 1
+            assert analyst_processor.process_analyst_data("AAPL", data) == []
+
+    def test_state_bounded(self):
+        data = {"upgrades_downgrades": [{"company": "MS", "gradeDate": "2025-01-02", "toGrade": "Buy"}]}
+        with patch.dict(analyst_processor._last_known, clear=True), \
+                patch.object(analyst_processor, "_LAST_KNOWN_MAX_SIZE", 2):
+            for symbol in ("AAPL", "MSFT", "NVDA"):
+                analyst_processor.process_analyst_data(symbol, data)
+            assert list(analyst_processor._last_known) == ["MSFT", "NVDA"]
+
+
+class TestEarningsProcessor:
+    def test_seen_periods_not_renotified_until_expiry(self):
+        earnings = [{"period": "2025-03-31", "actual": 1.5, "estimate": 1.0}]
+        with patch.object(earnings_processor, "_seen_earnings", TTLCache()):
+            with patch("data.cache.time.monotonic", return_value=1000.0):
+                assert len(earnings_processor.process_earnings("AAPL", earnings)) == 1
+                assert earnings_processor.process_earnings("AAPL", earnings) == []
+            later = 1000.0 + earnings_processor._SEEN_EARNINGS_TTL + 1
+            with patch("data.cache.time.monotonic", return_value=later):
+                assert len(earnings_processor.process_earnings("AAPL", earnings)) == 1
+
+
+class TestNewsProcessor:
+    def test_seen_urls_not_renotified_until_expiry(self):
+        articles = [{"url": "https://example.com/a", "title": "AAPL beats", "symbols": ["AAPL"]}]
+        with patch.object(news_processor, "_seen_urls", TTLCache()), \
+                patch.object(news_processor, "_initialized", True):
+            with patch("data.cache.time.monotonic", return_value=1000.0):
+                assert len(news_processor.process_news_articles(articles, {"AAPL"})) == 1
+                assert news_processor.process_news_articles(articles, {"AAPL"}) == []
+            later = 1000.0 + news_processor._SEEN_TTL + 1
+            with patch("data.cache.time.monotonic", return_value=later):
+                assert len(news_processor.process_news_articles(articles, {"AAPL"})) == 1
+
+
+class TestFactorGradeProcessor:
+    def test_percentile_counts_ties_as_half(self):
+        peers = [1.0, 2.0, 2.0, 3.0]
+        assert _compute_percentile(2.0, peers) == 50.0
+        assert _compute_percentile(3.5, peers) == 100.0
+        assert _compute_percentile(0.5, peers, higher_is_better=False) == 100.0
+        assert _compute_percentile(1.0, []) == 50.0
+
+    async def test_grades_without_price_history(self, mock_data_manager):
+        mock_data_manager.get_stock_peers = AsyncMock(return_value=[])
+        mock_data_manager.get_historical_prices = AsyncMock(side_effect=RuntimeError("down"))
+        grades = await FactorGradeProcessor(mock_data_manager).get_factor_grades("AAPL")
+        assert grades["sector"] == "Technology"
+        assert grades["peer_count"] == 12
+        assert grades["factor_grades"]["momentum"] == "B-"
+        mock_data_manager.get_historical_prices.assert_awaited_once_with("AAPL", limit=260)
+
+    async def test_portfolio_health_weights_by_position_value(self, mock_data_manager):
+        processor = FactorGradeProcessor(mock_data_manager)
+        grades = {
+            "AAPL": {"quant_rating": 4.0, "quant_label": "Buy", "factor_grades": {}, "sector": "Technology"},
+            "XOM": {"quant_rating": 2.0, "quant_label": "Sell", "factor_grades": {}, "sector": "Energy"},
+        }
+        processor.get_factor_grades = AsyncMock(side_effect=lambda symbol: grades[symbol])
+        health = await processor.get_portfolio_health([
+            {"symbol": "AAPL", "shares": 3, "cost_basis": 100},
+            {"symbol": "XOM", "shares": 1, "cost_basis": 100},
+        ])
+        assert health["portfolio_score"] == 3.5
+        assert health["herfindahl_index"] == 0.625
+        assert health["sector_allocation"] == {"Technology": 75.0, "Energy": 25.0}
+
+    async def test_peer_fetches_capped(self, mock_data_manager):
+        active = peak = 0
+
+        async def fundamentals(symbol):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0)
+            active -= 1
+            return {}
+
+        mock_data_manager.get_fundamentals = AsyncMock(side_effect=fundamentals)
+        with patch.object(factor_processor, "_PEER_CONCURRENCY", 3):
+            processor = FactorGradeProcessor(mock_data_manager)
+        peers = await processor._fetch_peer_data([f"P{i}" for i in range(10)])
+        assert len(peers) == 10
+        assert peak == 3
@@ -0,0 +1,82 @@
+"""Tests for utils/retry.py — backoff, jitter, Retry-After and retry budgets."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from utils.retry import RetryBudget, async_retry
+
+
+class Flaky(Exception):
+    def __init__(self, retry_after=None):
+        self.retry_after = retry_after
+        super().__init__("flaky")
+
+
+def failing(times, exc=Flaky):
+    calls = {"n": 0}
+
+    async def func():
+        calls["n"] += 1
+        if calls["n"] <= times:
+            raise exc()
+        return "ok"
+
+    return func, calls
+
+
+class TestAsyncRetry:
+    async def test_retries_then_succeeds(self):
+        func, calls = failing(2)
+        with patch("utils.retry.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            assert await async_retry(max_retries=3, base_delay=1.0)(func)() == "ok"
+        assert calls["n"] == 3
+        assert [c.args[0] for c in sleep.await_args_list] == [1.0, 2.0]
+
+    async def test_full_jitter_stays_within_backoff(self):
+        func, _ = failing(3)
+        with patch("utils.retry.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            await async_retry(max_retries=3, base_delay=1.0, jitter=True)(func)()
+        for attempt, call in enumerate(sleep.await_args_list):
+            assert 0 <= call.args[0] <= 2 ** attempt
+
+    async def test_retry_after_overrides_backoff(self):
+        func, _ = failing(1, exc=lambda: Flaky(retry_after=7.0))
+        with patch("utils.retry.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            await async_retry(max_retries=2, base_delay=1.0)(func)()
+        sleep.assert_awaited_once_with(7.0)
+
+    async def test_exhausted_budget_fails_fast(self):
+        budget = RetryBudget(ratio=0.1, min_retries=1)
+        func, calls = failing(5)
+        wrapped = async_retry(max_retries=3, budget=budget, budget_key=lambda: "api")(func)
+        with patch("utils.retry.asyncio.sleep", new_callable=AsyncMock):
+            with pytest.raises(Flaky):
+                await wrapped()
+        # One budgeted retry, then the second failure is raised immediately
+        assert calls["n"] == 2
+
+
+class TestRetryBudget:
+    def test_budget_grows_with_successes(self):
+        budget = RetryBudget(ratio=0.5, min_retries=0)
+        assert budget.try_spend("api") is False
+        for _ in range(4):
+            budget.record_success("api")
+        assert budget.try_spend("api") is True
+        assert budget.try_spend("api") is True
+        assert budget.try_spend("api") is False
+
+    def test_window_expiry_restores_budget(self):
+        budget = RetryBudget(min_retries=1, window=60.0)
+        with patch("utils.retry.time.monotonic", return_value=0.0):
+            assert budget.try_spend("api") is True
+            assert budget.try_spend("api") is False
+        with patch("utils.retry.time.monotonic", return_value=61.0):
+            assert budget.try_spend("api") is True
+
+    def test_successes_pruned_without_failures(self):
+        budget = RetryBudget(window=60.0)
+        for second in range(1000):
+            with patch("utils.retry.time.monotonic", return_value=float(second)):
+                budget.record_success("api")
+        assert len(budget._successes["api"]) == 60
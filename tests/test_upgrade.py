@@ -260,6 +260,7 @@ class TestDataManagerTechnicals:
         ])
         d.cache = MagicMock()
         d.cache.get = MagicMock(return_value=None)
+        d.cache.get_stale = MagicMock(return_value=None)
         d.cache.set = MagicMock()
         return d
 
@@ -334,22 +335,74 @@ class TestDashboardPriceChart:
             for i in range(1, 11)
         ])
 
-        with patch("dashboard.generator.render_to_discord_file") as mock_render:
-            mock_render.return_value = MagicMock()
+        with patch("dashboard.generator.render_to_bytes_async", new_callable=AsyncMock) as mock_render:
+            mock_render.return_value = b"png"
             from dashboard.generator import DashboardGenerator
             gen = DashboardGenerator(mock_data_manager)
             files = await gen.generate_price_chart("AAPL")
             assert len(files) == 1
             mock_render.assert_called_once()
 
+    async def test_repeat_chart_served_from_cache(self, mock_data_manager):
+        mock_data_manager.get_historical_prices = AsyncMock(return_value=[
+            {"date": "2025-02-03", "open": 200, "high": 204,
+             "low": 199, "close": 203, "volume": 500000}
+        ])
+
+        with patch("dashboard.generator.render_to_bytes_async", new_callable=AsyncMock) as mock_render:
+            mock_render.return_value = b"png"
+            from dashboard.generator import DashboardGenerator, _chart_cache
+            _chart_cache.clear()
+            gen = DashboardGenerator(mock_data_manager)
+            first = await gen.generate_price_chart("MSFT")
+            second = await gen.generate_price_chart("MSFT")
+            assert len(first) == len(second) == 1
+            mock_render.assert_called_once()
+
+    async def test_expired_charts_swept_on_render(self, mock_data_manager):
+        mock_data_manager.get_historical_prices = AsyncMock(return_value=[
+            {"date": "2025-02-03", "open": 200, "high": 204,
+             "low": 199, "close": 203, "volume": 500000}
+        ])
+
+        with patch("dashboard.generator.render_to_bytes_async", new_callable=AsyncMock) as mock_render:
+            mock_render.return_value = b"png"
+            from dashboard.generator import DashboardGenerator, _chart_cache
+            _chart_cache.clear()
+            gen = DashboardGenerator(mock_data_manager)
+            with patch("data.cache.time.monotonic", return_value=0.0):
+                await gen.generate_price_chart("MSFT")
+            with patch("data.cache.time.monotonic", return_value=1e9):
+                await gen.generate_price_chart("NVDA")
+            # The expired MSFT chart is gone from both the store and the expiry heap
+            assert len(_chart_cache._store) == len(_chart_cache._expiry) == 1
+
+    async def test_watchlist_skips_cancelled_quotes(self, mock_data_manager):
+        import asyncio
+
+        async def quote(symbol):
+            if symbol == "TSLA":
+                raise asyncio.CancelledError()
+            return {"c": 100.0, "dp": 1.0}
+
+        mock_data_manager.get_quote = AsyncMock(side_effect=quote)
+        with patch("dashboard.generator.render_to_bytes_async", new_callable=AsyncMock) as mock_render, \
+                patch("dashboard.generator.comparison_chart") as mock_chart:
+            mock_render.return_value = b"png"
+            from dashboard.generator import DashboardGenerator, _chart_cache
+            _chart_cache.clear()
+            files = await DashboardGenerator(mock_data_manager).generate_watchlist_dashboard(["AAPL", "TSLA"])
+        assert len(files) == 1
+        assert mock_chart.call_args.args[1] == [{"c": 100.0, "dp": 1.0}]
+
     async def test_generate_chart_price_type(self, mock_data_manager):
         mock_data_manager.get_historical_prices = AsyncMock(return_value=[
             {"date": "2025-01-01", "open": 180, "high": 186,
              "low": 179, "close": 185, "volume": 1000000}
         ])
 
-        with patch("dashboard.generator.render_to_discord_file") as mock_render:
-            mock_render.return_value = MagicMock()
+        with patch("dashboard.generator.render_to_bytes_async", new_callable=AsyncMock) as mock_render:
+            mock_render.return_value = b"png"
             from dashboard.generator import DashboardGenerator
             gen = DashboardGenerator(mock_data_manager)
             files = await gen.generate_chart("price_chart", symbols=["AAPL"])
@@ -435,3 +488,81 @@ class TestRateLimiterNotifications:
         # No callback set — should not error
         await rl.acquire("test_api")
         await rl.acquire("test_api")  # triggers throttle, no callback — should not crash
+
+
+class TestSlidingWindowLimiter:
+    def test_never_exceeds_limit_in_any_minute(self):
+        from data.rate_limiter import SlidingWindowLimiter
+        window = SlidingWindowLimiter(2)
+        assert window.reserve(59.0) == 0
+        assert window.reserve(59.0) == 0
+        # A fresh minute boundary doesn't reset the window
+        assert window.reserve(61.0) == pytest.approx(58.0)
+        assert window.used(61.0) == 2
+
+    def test_slots_free_up_after_sixty_seconds(self):
+        from data.rate_limiter import SlidingWindowLimiter
+        window = SlidingWindowLimiter(1)
+        window.reserve(0.0)
+        assert window.reserve(60.0) == 0
+
+    def test_configure_selects_algorithm(self):
+        from data.rate_limiter import RateLimiter, SlidingWindowLimiter, GCRALimiter
+        rl = RateLimiter()
+        rl.configure("marketaux", 5, "sliding")
+        rl.configure("fred", 120)
+        assert isinstance(rl._buckets["marketaux"], SlidingWindowLimiter)
+        assert isinstance(rl._buckets["fred"], GCRALimiter)
+
+    @pytest.mark.parametrize("api", ["fmp", "finnhub"])
+    async def test_fan_out_runs_without_sleeping(self, api):
+        import asyncio
+        from config.constants import RATE_LIMIT_ALGORITHMS
+        from data.rate_limiter import RateLimiter
+        rl = RateLimiter()
+        rl.configure(api, 30, RATE_LIMIT_ALGORITHMS.get(api, "gcra"))
+        # e.g. FMP's 11 sector-performance calls
+        with patch("data.rate_limiter.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            await asyncio.gather(*(rl.acquire(api) for _ in range(11)))
+        sleep.assert_not_awaited()
+
+
+class TestGCRALimiter:
+    def test_allows_full_burst_then_spaces_requests(self):
+        from data.rate_limiter import GCRALimiter
+        bucket = GCRALimiter(6, burst=3)  # 3 + 3 refills per minute → 15s emission interval
+        waits = [bucket.reserve(1000.0) for _ in range(5)]
+        assert all(w <= 0 for w in waits[:3])
+        assert waits[3] == pytest.approx(15.0)
+        assert waits[4] == pytest.approx(30.0)
+
+    @pytest.mark.parametrize("rpm,burst", [(55, None), (55, 55), (30, None), (5, 1), (120, 12)])
+    def test_burst_plus_refill_stays_within_quota(self, rpm, burst):
+        import bisect
+        from data.rate_limiter import GCRALimiter
+        bucket = GCRALimiter(rpm, burst)
+        # A caller hammering every 50ms for 5 minutes of fake time; each call
+        # runs once its reserved wait has elapsed
+        starts = sorted(
+            now + max(0.0, bucket.reserve(now))
+            for now in (i * 0.05 for i in range(6000))
+        )
+        # Allow float noise at the exact 60s boundary
+        busiest = max(bisect.bisect_left(starts, t + 60.0 - 1e-6) - i for i, t in enumerate(starts))
+        assert busiest == rpm
+
+    def test_idle_time_refills_burst(self):
+        from data.rate_limiter import GCRALimiter
+        bucket = GCRALimiter(2, burst=2)
+        bucket.reserve(0.0)
+        bucket.reserve(0.0)
+        assert bucket.reserve(0.0) > 0
+        assert bucket.reserve(1000.0) <= 0
+
+    def test_used_reflects_backlog(self):
+        from data.rate_limiter import GCRALimiter
+        bucket = GCRALimiter(10)
+        assert bucket.used(0.0) == 0
+        for _ in range(3):
+            bucket.reserve(0.0)
+        assert bucket.used(0.0) == 3
@@ -1,8 +1,11 @@
-"""Async retry decorator with exponential backoff."""
+"""Async retry decorator with exponential backoff, full jitter and retry budgets."""
 
 import asyncio
 import functools
+import random
 import re
+import time
+from collections import deque
 from collections.abc import Awaitable, Callable
 from typing import ParamSpec, TypeVar
 import structlog
@@ -24,26 +27,82 @@ def _sanitize_error(error: str) -> str:
     return _SENSITIVE_PARAMS.sub(r"\1[REDACTED]", error)
 
 
+class RetryBudget:
+    """Cap retries per key to a fraction of recent successful calls.
+
+    Without a budget every failing caller retries independently, so an
+    unhealthy upstream sees its load multiplied. Within a sliding ``window``
+    (seconds) a key may retry at most ``max(min_retries, ratio * successes)``
+    times; beyond that callers fail fast.
+    """
+
+    def __init__(self, ratio: float = 0.1, min_retries: int = 3, window: float = 60.0) -> None:
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self._successes: dict[str, deque[float]] = {}
+        self._retries: dict[str, deque[float]] = {}
+
+    def _prune(self, events: deque[float], now: float) -> deque[float]:
+        cutoff = now - self.window
+        while events and events[0] <= cutoff:
+            events.popleft()
+        return events
+
+    def record_success(self, key: str) -> None:
+        # Prune here too: a key that never fails never reaches try_spend
+        now = time.monotonic()
+        self._prune(self._successes.setdefault(key, deque()), now).append(now)
+
+    def try_spend(self, key: str) -> bool:
+        """Consume one retry for ``key`` if the budget allows it."""
+        now = time.monotonic()
+        successes = self._prune(self._successes.setdefault(key, deque()), now)
+        retries = self._prune(self._retries.setdefault(key, deque()), now)
+        if len(retries) >= max(self.min_retries, int(len(successes) * self.ratio)):
+            return False
+        retries.append(now)
+        return True
+
+
 def async_retry(
     max_retries: int = 3,
     base_delay: float = 1.0,
     max_delay: float = 60.0,
     exceptions: tuple[type[Exception], ...] = (Exception,),
+    jitter: bool = False,
+    budget: RetryBudget | None = None,
+    budget_key: Callable[..., str] | None = None,
 ) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
-    """Decorator for async functions with exponential backoff retry."""
+    """Decorator for async functions with exponential backoff retry.
+
+    ``jitter=True`` sleeps a uniform random time in ``[0, backoff]`` (full
+    jitter) so concurrent failures don't retry in lockstep. An exception with a
+    ``retry_after`` attribute (seconds) overrides the computed delay. With a
+    ``budget``, ``budget_key(*args, **kwargs)`` names the bucket that successes
+    are credited to and retries are charged against.
+    """
 
     def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
         @functools.wraps(func)
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            key = budget_key(*args, **kwargs) if budget and budget_key else func.__name__
             last_exception: Exception | None = None
             for attempt in range(max_retries + 1):
                 try:
-                    return await func(*args, **kwargs)
+                    result = await func(*args, **kwargs)
                 except exceptions as e:
                     last_exception = e
                     if attempt == max_retries:
                         break
-                    delay = min(base_delay * (2 ** attempt), max_delay)
+                    if budget is not None and not budget.try_spend(key):
+                        log.warning("retry_budget_exhausted", func=func.__name__, key=key)
+                        break
+                    backoff = min(base_delay * (2 ** attempt), max_delay)
+                    delay = random.uniform(0, backoff) if jitter else backoff
+                    retry_after = getattr(e, "retry_after", None)
+                    if retry_after is not None:
+                        delay = min(retry_after, max_delay)
                     log.warning(
                         "retry_attempt",
                         func=func.__name__,
@@ -53,6 +112,10 @@ def async_retry(
                         error=_sanitize_error(str(e)),
                     )
                     await asyncio.sleep(delay)
+                else:
+                    if budget is not None:
+                        budget.record_success(key)
+                    return result
             raise last_exception  # type: ignore[misc]
 
         return wrapper